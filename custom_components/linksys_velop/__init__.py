@@ -1,21 +1,25 @@
 """The Linksys Velop integration."""
 
 # region #-- imports --#
+import asyncio
 import copy
 import logging
+import time
+from collections.abc import Coroutine
 from datetime import datetime, timedelta
+from functools import partial
 from typing import Any
 
+from homeassistant.components.device_tracker import CONF_CONSIDER_HOME
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.config_entries import entity_registry as er
 from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.device_registry import DeviceEntry, DeviceRegistry
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.device_registry import DeviceEntry
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.issue_registry import IssueSeverity
 from pyvelop.device import Device
@@ -25,21 +29,32 @@ from pyvelop.exceptions import (
     MeshException,
     MeshTimeoutError,
 )
-from pyvelop.mesh import Mesh
 
 from .const import (
+    CONF_ADAPTIVE_SCAN_INTERVAL,
     CONF_API_REQUEST_TIMEOUT,
     CONF_DEVICE_TRACKERS,
     CONF_DEVICE_TRACKERS_TO_REMOVE,
+    CONF_EVENTS_BULK_THRESHOLD,
     CONF_EVENTS_OPTIONS,
     CONF_NODE,
     CONF_SCAN_INTERVAL_DEVICE_TRACKER,
+    CONF_SCAN_INTERVAL_MAX,
+    CONF_SCAN_INTERVAL_MIN,
+    CONF_SCAN_INTERVAL_SLOW_TIER,
     CONF_SELECT_TEMP_UI_DEVICE,
+    CONF_STALE_MAX_AGE,
+    CONF_STALE_MAX_FAILURES,
+    CONF_UI_DEVICES_LEAN_CHANGED,
     CONF_UI_DEVICES_TO_REMOVE,
+    DEF_ADAPTIVE_SCAN_INTERVAL,
     DEF_API_REQUEST_TIMEOUT,
     DEF_EVENTS_OPTIONS,
     DEF_SCAN_INTERVAL,
     DEF_SCAN_INTERVAL_DEVICE_TRACKER,
+    DEF_SCAN_INTERVAL_MAX,
+    DEF_SCAN_INTERVAL_MIN,
+    DEF_SCAN_INTERVAL_SLOW_TIER,
     DEF_SELECT_TEMP_UI_DEVICE,
     DEVICE_TRACKER_DOMAIN,
     DOMAIN,
@@ -47,21 +62,26 @@ from .const import (
     ISSUE_MISSING_DEVICE_TRACKER,
     PLATFORMS,
     SELECT_DOMAIN,
-    SIGNAL_DEVICE_TRACKER_UPDATE,
 )
 from .coordinator import (
+    AdaptiveInterval,
     LinksysVelopUpdateCoordinator,
     LinksysVelopUpdateCoordinatorChannelScan,
     LinksysVelopUpdateCoordinatorSpeedtest,
 )
 from .exceptions import DeviceTrackerMeshTimeout, GeneralException, IntensiveTaskRunning
 from .helpers import (
-    get_mesh_device_for_config_entry,
-    remove_velop_device_from_registry,
+    get_velop_entities_by_unique_id,
+    remove_mesh_device_connections,
+    remove_velop_devices_from_registry,
+    remove_velop_entities_from_registry,
     remove_velop_entity_from_registry,
 )
 from .logger import Logger
+from .mesh import LinksysVelopMesh
+from .presence import PresenceEngine
 from .service_handler import LinksysVelopServiceHandler
+from .storage import KnownDeviceStore, MeshSnapshotStore
 from .types import CoordinatorTypes, LinksysVelopConfigEntry, LinksysVelopData
 
 # endregion
@@ -69,6 +89,28 @@ from .types import CoordinatorTypes, LinksysVelopConfigEntry, LinksysVelopData
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 _SETUP_PLATFORMS: list[str] = []
 
+# options that can be applied without reloading the config entry
+_HOT_OPTIONS: set[str] = {
+    CONF_ADAPTIVE_SCAN_INTERVAL,
+    CONF_API_REQUEST_TIMEOUT,
+    CONF_CONSIDER_HOME,
+    CONF_EVENTS_BULK_THRESHOLD,
+    CONF_SCAN_INTERVAL,
+    CONF_SCAN_INTERVAL_DEVICE_TRACKER,
+    CONF_SCAN_INTERVAL_MAX,
+    CONF_SCAN_INTERVAL_MIN,
+    CONF_SCAN_INTERVAL_SLOW_TIER,
+    CONF_STALE_MAX_AGE,
+    CONF_STALE_MAX_FAILURES,
+}
+# written by the options flow for the next setup to act on, so they don't
+# need a reload of their own
+_TRANSIENT_OPTIONS: set[str] = {
+    CONF_DEVICE_TRACKERS_TO_REMOVE,
+    CONF_UI_DEVICES_LEAN_CHANGED,
+    CONF_UI_DEVICES_TO_REMOVE,
+}
+
 
 async def async_remove_config_entry_device(
     hass: HomeAssistant,  # pylint: disable=unused-argument
@@ -91,6 +133,135 @@ async def async_remove_config_entry_device(
     return True
 
 
+def _build_adaptive_interval(
+    config_entry: LinksysVelopConfigEntry,
+) -> AdaptiveInterval | None:
+    """Build the adaptive interval for the mesh coordinator, if enabled."""
+    if not config_entry.options.get(
+        CONF_ADAPTIVE_SCAN_INTERVAL, DEF_ADAPTIVE_SCAN_INTERVAL
+    ):
+        return None
+
+    return AdaptiveInterval(
+        min_secs=config_entry.options.get(
+            CONF_SCAN_INTERVAL_MIN, DEF_SCAN_INTERVAL_MIN
+        ),
+        max_secs=config_entry.options.get(
+            CONF_SCAN_INTERVAL_MAX, DEF_SCAN_INTERVAL_MAX
+        ),
+    )
+
+
+def _get_device_tracker_interval(config_entry: LinksysVelopConfigEntry) -> timedelta:
+    """Get the configured interval for the device tracker timer."""
+    return timedelta(
+        seconds=config_entry.options.get(
+            CONF_SCAN_INTERVAL_DEVICE_TRACKER, DEF_SCAN_INTERVAL_DEVICE_TRACKER
+        )
+    )
+
+
+async def _async_device_tracker_update(
+    hass: HomeAssistant, config_entry: LinksysVelopConfigEntry, _: datetime
+) -> None:
+    """Retrieve the tracked devices from the Mesh.
+
+    The devices are only requested from the API if the mesh coordinator
+    hasn't gathered them since the last time the timer fired, and then only
+    the details needed for presence are requested.  Only the device trackers
+    for devices that have changed are updated.
+    """
+    mesh_coordinator: LinksysVelopUpdateCoordinator = (
+        config_entry.runtime_data.coordinators[CoordinatorTypes.MESH]
+    )
+    mesh: LinksysVelopMesh = mesh_coordinator.data
+    tracked_devices: list[str] = config_entry.options.get(CONF_DEVICE_TRACKERS, [])
+    try:
+        devices: list[Device]
+        if mesh_coordinator.is_fresh(_get_device_tracker_interval(config_entry)):
+            devices = await mesh.async_get_device_from_id(tracked_devices)
+        else:
+            devices = await mesh.async_get_device_presence(tracked_devices)
+        config_entry.runtime_data.presence_engine.async_process(devices)
+    except MeshDeviceNotFoundResponse as err:
+        config_entities: dict[str, er.RegistryEntry] = get_velop_entities_by_unique_id(
+            hass, config_entry.entry_id
+        )
+        for tracker_missing in err.devices:
+            tracker_entity: er.RegistryEntry | None
+            if (
+                tracker_entity := config_entities.get(
+                    f"{config_entry.entry_id}::{DEVICE_TRACKER_DOMAIN}::{tracker_missing}"
+                )
+            ) is not None:
+                # region #-- raise an issue --#
+                ir.async_create_issue(
+                    hass,
+                    DOMAIN,
+                    ISSUE_MISSING_DEVICE_TRACKER,
+                    data={
+                        "device_id": tracker_entity.entity_id,
+                        "device_name": tracker_entity.name
+                        or tracker_entity.original_name,
+                    },
+                    is_fixable=True,
+                    is_persistent=False,
+                    severity=IssueSeverity.ERROR,
+                    translation_key=ISSUE_MISSING_DEVICE_TRACKER,
+                    translation_placeholders={
+                        "device_name": tracker_entity.name
+                        or tracker_entity.original_name
+                    },
+                )
+                # endregion
+    except (MeshConnectionError, MeshTimeoutError) as err:
+        if len(config_entry.runtime_data.intensive_running_tasks) > 0:
+            exc: IntensiveTaskRunning = IntensiveTaskRunning(
+                translation_domain=DOMAIN,
+                translation_key="intensive_task",
+                translation_placeholders={
+                    "tasks": config_entry.runtime_data.intensive_running_tasks
+                },
+            )
+            _LOGGER.warning(exc)
+        else:
+            exc_timeout: DeviceTrackerMeshTimeout = DeviceTrackerMeshTimeout(
+                translation_domain=DOMAIN, translation_key="device_tracker_timeout"
+            )
+            _LOGGER.warning(exc_timeout)
+    except Exception as err:
+        exc_general: GeneralException = GeneralException(
+            translation_domain=DOMAIN,
+            translation_key="general",
+            translation_placeholders={
+                "exc_type": type(err),
+                "exc_msg": err,
+            },
+        )
+        _LOGGER.warning(exc_general)
+
+
+@callback
+def _async_start_device_tracker_timer(
+    hass: HomeAssistant, config_entry: LinksysVelopConfigEntry
+) -> None:
+    """Start the device tracker timer, replacing any that is running."""
+    _async_stop_device_tracker_timer(config_entry)
+    config_entry.runtime_data.device_tracker_timer = async_track_time_interval(
+        hass,
+        partial(_async_device_tracker_update, hass, config_entry),
+        _get_device_tracker_interval(config_entry),
+    )
+
+
+@callback
+def _async_stop_device_tracker_timer(config_entry: LinksysVelopConfigEntry) -> None:
+    """Stop the device tracker timer."""
+    if config_entry.runtime_data.device_tracker_timer is not None:
+        config_entry.runtime_data.device_tracker_timer()
+        config_entry.runtime_data.device_tracker_timer = None
+
+
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: LinksysVelopConfigEntry
 ) -> bool:
@@ -99,14 +270,14 @@ async def async_setup_entry(
     global _SETUP_PLATFORMS
 
     log_formatter = Logger(unique_id=config_entry.unique_id)
-    _LOGGER.debug(log_formatter.format("entered"))
+    log_formatter.debug(_LOGGER, "entered")
 
     # region #-- initialise runtime data --#
     config_entry.runtime_data = LinksysVelopData()
     # endregion
 
-    _LOGGER.debug(log_formatter.format("setting up Mesh for the coordinator"))
-    mesh: Mesh = Mesh(
+    log_formatter.debug(_LOGGER, "setting up Mesh for the coordinator")
+    mesh: LinksysVelopMesh = LinksysVelopMesh(
         node=config_entry.options[CONF_NODE],
         password=config_entry.options[CONF_PASSWORD],
         request_timeout=config_entry.options.get(
@@ -115,18 +286,9 @@ async def async_setup_entry(
         session=async_get_clientsession(hass=hass),
     )
 
-    # region #-- test auth --#
-    valid_auth: bool = await mesh.async_test_credentials()
-    if not valid_auth:
-        raise ConfigEntryAuthFailed(
-            translation_domain=DOMAIN,
-            translation_key="failed_login",
-        )
-    # endregion
-
     # region #-- setup the coordinators --#
     # region #--- mesh coordinator --#
-    _LOGGER.debug(log_formatter.format("setting up the mesh coordinator"))
+    log_formatter.debug(_LOGGER, "setting up the mesh coordinator")
     coordinator_name = f"{DOMAIN} mesh"
     if getattr(log_formatter, "_unique_id"):
         coordinator_name += f" ({getattr(log_formatter, '_unique_id')})"
@@ -140,14 +302,15 @@ async def async_setup_entry(
             update_interval_secs=config_entry.options.get(
                 CONF_SCAN_INTERVAL, DEF_SCAN_INTERVAL
             ),
+            slow_tier_interval_secs=config_entry.options.get(
+                CONF_SCAN_INTERVAL_SLOW_TIER, DEF_SCAN_INTERVAL_SLOW_TIER
+            ),
+            adaptive_interval=_build_adaptive_interval(config_entry),
         )
     )
-    await config_entry.runtime_data.coordinators[
-        CoordinatorTypes.MESH
-    ].async_config_entry_first_refresh()
     # endregion
     # region #-- speedtest coordinator --#
-    _LOGGER.debug(log_formatter.format("setting up the speedtest coordinator"))
+    log_formatter.debug(_LOGGER, "setting up the speedtest coordinator")
     coordinator_name = f"{DOMAIN} speedtest"
     if getattr(log_formatter, "_unique_id"):
         coordinator_name += f" ({getattr(log_formatter, '_unique_id')})"
@@ -163,12 +326,9 @@ async def async_setup_entry(
             ),
         )
     )
-    await config_entry.runtime_data.coordinators[
-        CoordinatorTypes.SPEEDTEST
-    ].async_config_entry_first_refresh()
     # endregion
     # region #-- channel scan coordinator --#
-    _LOGGER.debug(log_formatter.format("setting up the channel scan coordinator"))
+    log_formatter.debug(_LOGGER, "setting up the channel scan coordinator")
     coordinator_name = f"{DOMAIN} channel scan"
     if getattr(log_formatter, "_unique_id"):
         coordinator_name += f" ({getattr(log_formatter, '_unique_id')})"
@@ -184,94 +344,92 @@ async def async_setup_entry(
             ),
         )
     )
-    await config_entry.runtime_data.coordinators[
-        CoordinatorTypes.CHANNEL_SCAN
-    ].async_config_entry_first_refresh()
     # endregion
     # endregion
 
-    # region #-- setup the timer for device trackers --#
-    async def async_device_tracker_update(_: datetime) -> None:
-        """Retrieve the tracked devices from the Mesh."""
+    # region #-- restore the last known state of the mesh --#
+    mesh_coordinator: LinksysVelopUpdateCoordinator = (
+        config_entry.runtime_data.coordinators[CoordinatorTypes.MESH]
+    )
+    config_entry.runtime_data.known_devices = KnownDeviceStore(
+        hass, config_entry.entry_id
+    )
+    await config_entry.runtime_data.known_devices.async_load()
+    config_entry.runtime_data.snapshot_store = MeshSnapshotStore(
+        hass, config_entry.entry_id
+    )
+    restored: bool = await config_entry.runtime_data.snapshot_store.async_restore(mesh)
+    if restored:
+        mesh_coordinator.async_set_restored_data()
+    # endregion
+
+    # region #-- test auth and refresh the coordinators --#
+    # if the mesh was restored it's refreshed in the background once set up
+    first_refreshes: dict[str, Coroutine[Any, Any, Any]] = {}
+    if not restored:
+        first_refreshes["credentials"] = mesh.async_test_credentials()
+    first_refreshes |= {
+        coordinator_type: coordinator.async_config_entry_first_refresh()
+        for coordinator_type, coordinator in (
+            config_entry.runtime_data.coordinators.items()
+        )
+        if not restored or coordinator_type != CoordinatorTypes.MESH
+    }
+    timings: dict[str, float] = {}
+
+    async def _async_timed(step: str, coro) -> Any:
+        """Await the coroutine, recording how long it took."""
+        start: float = time.perf_counter()
         try:
-            devices: list[Device] = await mesh.async_get_device_from_id(
-                config_entry.options.get(CONF_DEVICE_TRACKERS, []), True
-            )
-            for device in devices:
-                async_dispatcher_send(
-                    hass,
-                    f"{SIGNAL_DEVICE_TRACKER_UPDATE}_{device.unique_id}",
-                    device,
-                )
-        except MeshDeviceNotFoundResponse as err:
-            for tracker_missing in err.devices:
-                entity_registry: er.EntityRegistry = er.async_get(hass)
-                config_entities: list[er.RegistryEntry] = (
-                    er.async_entries_for_config_entry(
-                        entity_registry, config_entry.entry_id
-                    )
-                )
-                tracker_entity: list[er.RegistryEntry]
-                if tracker_entity := [
-                    e
-                    for e in config_entities
-                    if e.unique_id
-                    == f"{config_entry.entry_id}::{DEVICE_TRACKER_DOMAIN}::{tracker_missing}"
-                ]:
-                    # region #-- raise an issue --#
-                    ir.async_create_issue(
-                        hass,
-                        DOMAIN,
-                        ISSUE_MISSING_DEVICE_TRACKER,
-                        data={
-                            "device_id": tracker_entity[0].entity_id,
-                            "device_name": tracker_entity[0].name
-                            or tracker_entity[0].original_name,
-                        },
-                        is_fixable=True,
-                        is_persistent=False,
-                        severity=IssueSeverity.ERROR,
-                        translation_key=ISSUE_MISSING_DEVICE_TRACKER,
-                        translation_placeholders={
-                            "device_name": tracker_entity[0].name
-                            or tracker_entity[0].original_name
-                        },
-                    )
-                    # endregion
-        except (MeshConnectionError, MeshTimeoutError) as err:
-            if len(config_entry.runtime_data.intensive_running_tasks) > 0:
-                exc: IntensiveTaskRunning = IntensiveTaskRunning(
-                    translation_domain=DOMAIN,
-                    translation_key="intensive_task",
-                    translation_placeholders={
-                        "tasks": config_entry.runtime_data.intensive_running_tasks
-                    },
-                )
-                _LOGGER.warning(exc)
-            else:
-                exc_timeout: DeviceTrackerMeshTimeout = DeviceTrackerMeshTimeout(
-                    translation_domain=DOMAIN, translation_key="device_tracker_timeout"
-                )
-                _LOGGER.warning(exc_timeout)
-        except Exception as err:
-            exc_general: GeneralException = GeneralException(
-                translation_domain=DOMAIN,
-                translation_key="general",
-                translation_placeholders={
-                    "exc_type": type(err),
-                    "exc_msg": err,
-                },
-            )
-            _LOGGER.warning(exc_general)
+            return await coro
+        finally:
+            timings[step] = time.perf_counter() - start
+
+    setup_start: float = time.perf_counter()
+    results: dict[str, Any] = dict(
+        zip(
+            first_refreshes,
+            await asyncio.gather(
+                *[_async_timed(step, coro) for step, coro in first_refreshes.items()],
+                return_exceptions=True,
+            ),
+        )
+    )
+    log_formatter.debug(
+        _LOGGER,
+        "first refresh took %.3fs (%s)",
+        time.perf_counter() - setup_start,
+        ", ".join(f"{step}: {secs:.3f}s" for step, secs in timings.items()),
+    )
 
-    if len(config_entry.options.get(CONF_DEVICE_TRACKERS, [])) > 0:
-        scan_interval = config_entry.options.get(
-            CONF_SCAN_INTERVAL_DEVICE_TRACKER, DEF_SCAN_INTERVAL_DEVICE_TRACKER
+    # invalid credentials take precedence as the refreshes will fail because of them
+    if results.get("credentials") is False:
+        raise ConfigEntryAuthFailed(
+            translation_domain=DOMAIN,
+            translation_key="failed_login",
         )
+    errors: list[BaseException] = [
+        result for result in results.values() if isinstance(result, BaseException)
+    ]
+    if auth_failed := [err for err in errors if isinstance(err, ConfigEntryAuthFailed)]:
+        raise auth_failed[0]
+    if errors:
+        if isinstance(errors[0], MeshException):
+            raise ConfigEntryNotReady from errors[0]
+        raise errors[0]
+    # endregion
+
+    # region #-- setup the timer for device trackers --#
+    config_entry.runtime_data.presence_engine = PresenceEngine(
+        hass, unique_id=config_entry.unique_id
+    )
+    config_entry.async_on_unload(
+        config_entry.runtime_data.presence_engine.async_shutdown
+    )
+    if len(config_entry.options.get(CONF_DEVICE_TRACKERS, [])) > 0:
+        _async_start_device_tracker_timer(hass, config_entry)
         config_entry.async_on_unload(
-            async_track_time_interval(
-                hass, async_device_tracker_update, timedelta(seconds=scan_interval)
-            )
+            lambda: _async_stop_device_tracker_timer(config_entry)
         )
     # endregion
 
@@ -295,50 +453,50 @@ async def async_setup_entry(
     else:
         if DEVICE_TRACKER_DOMAIN in _SETUP_PLATFORMS:
             _SETUP_PLATFORMS.remove(DEVICE_TRACKER_DOMAIN)
-    _LOGGER.debug(log_formatter.format("setting up platforms: %s"), _SETUP_PLATFORMS)
+    log_formatter.debug(_LOGGER, "setting up platforms: %s", _SETUP_PLATFORMS)
     await hass.config_entries.async_forward_entry_setups(config_entry, _SETUP_PLATFORMS)
     # endregion
 
     # region #-- remove unnecessary ui devices --#
-    _LOGGER.debug(log_formatter.format("cleaning up ui devices"))
-    for ui_device in config_entry.options.get(CONF_UI_DEVICES_TO_REMOVE, []):
-        remove_velop_device_from_registry(hass, ui_device)
+    log_formatter.debug(_LOGGER, "cleaning up ui devices")
+    remove_velop_devices_from_registry(
+        hass, config_entry.options.get(CONF_UI_DEVICES_TO_REMOVE, [])
+    )
     new_options = copy.deepcopy(dict(config_entry.options))
     new_options.get(CONF_UI_DEVICES_TO_REMOVE, []).clear()
+    # the platforms have updated the registry for any change to lean mode
+    new_options.pop(CONF_UI_DEVICES_LEAN_CHANGED, None)
     hass.config_entries.async_update_entry(config_entry, options=new_options)
     # endregion
 
     # region #-- remove unnecessary device trackers --#
-    _LOGGER.debug(log_formatter.format("cleaning up device trackers"))
+    log_formatter.debug(_LOGGER, "cleaning up device trackers")
+    trackers_to_remove: list[str] = config_entry.options.get(
+        CONF_DEVICE_TRACKERS_TO_REMOVE, []
+    )
+    remove_velop_entities_from_registry(
+        hass,
+        config_entry.entry_id,
+        [
+            f"{config_entry.entry_id}::{DEVICE_TRACKER_DOMAIN}::{tracker}"
+            for tracker in trackers_to_remove
+        ],
+    )
     connections: set[tuple[str, str]] = set()
-    mesh_device: DeviceEntry = get_mesh_device_for_config_entry(hass, config_entry)
-    if mesh_device is not None:
-        connections = mesh_device.connections
-    for tracker in config_entry.options.get(CONF_DEVICE_TRACKERS_TO_REMOVE, []):
-        # region #-- remove entity --#
-        remove_velop_entity_from_registry(
-            hass,
-            config_entry.entry_id,
-            f"{config_entry.entry_id}::{DEVICE_TRACKER_DOMAIN}::{tracker}",
-        )
-        # endregion
-        # region #-- remove connection from the mesh device --#
-        device: Device
-        if device := [d for d in mesh.devices if d.unique_id == tracker]:
-            if adapter := [a for a in device[0].network]:
-                connections.discard(
+    devices_by_id: dict[str, Device] = config_entry.runtime_data.coordinators[
+        CoordinatorTypes.MESH
+    ].devices_by_id
+    for tracker in trackers_to_remove:
+        device: Device | None
+        if (device := devices_by_id.get(tracker)) is not None:
+            if adapter := [a for a in device.network]:
+                connections.add(
                     (
                         dr.CONNECTION_NETWORK_MAC,
                         dr.format_mac(adapter[0].get("mac", "")),
                     )
                 )
-        # endregion
-
-    # region #-- update the mesh device --#
-    device_registry: DeviceRegistry = dr.async_get(hass)
-    mesh_device: DeviceEntry = get_mesh_device_for_config_entry(hass, config_entry)
-    device_registry.async_update_device(mesh_device.id, new_connections=connections)
-    # endregion
+    remove_mesh_device_connections(hass, config_entry, connections)
 
     new_options = copy.deepcopy(dict(config_entry.options))
     new_options.get(CONF_DEVICE_TRACKERS_TO_REMOVE, []).clear()
@@ -346,19 +504,42 @@ async def async_setup_entry(
     # endregion
 
     # region #-- service definition --#
-    _LOGGER.debug(log_formatter.format("registering services"))
+    log_formatter.debug(_LOGGER, "registering services")
     config_entry.runtime_data.service_handler = LinksysVelopServiceHandler(hass)
     config_entry.runtime_data.service_handler.register_services()
     # endregion
 
     # region #-- listen for config changes --#
-    _LOGGER.debug(log_formatter.format("listening for config changes"))
+    log_formatter.debug(_LOGGER, "listening for config changes")
+    config_entry.runtime_data.options = copy.deepcopy(dict(config_entry.options))
     config_entry.async_on_unload(
         config_entry.add_update_listener(_async_update_listener)
     )
     # endregion
 
-    _LOGGER.debug(log_formatter.format("exited"))
+    # region #-- refresh the restored mesh --#
+    if restored:
+
+        async def _async_background_refresh() -> None:
+            """Replace the restored details with those from the mesh."""
+            try:
+                valid_auth: bool = await mesh.async_test_credentials()
+            except MeshException:
+                # leave the refresh to report the problem
+                valid_auth = True
+            if not valid_auth:
+                config_entry.async_start_reauth(hass)
+                return
+            await mesh_coordinator.async_refresh()
+
+        config_entry.async_create_background_task(
+            hass,
+            _async_background_refresh(),
+            f"{DOMAIN} mesh refresh ({config_entry.entry_id})",
+        )
+    # endregion
+
+    log_formatter.debug(_LOGGER, "exited")
 
     return True
 
@@ -368,29 +549,106 @@ async def async_unload_entry(
 ) -> bool:
     """Cleanup when unloading a config entry."""
     log_formatter = Logger(unique_id=config_entry.unique_id)
-    _LOGGER.debug(log_formatter.format("entered"))
+    log_formatter.debug(_LOGGER, "entered")
 
     # region #-- remove services but only if there are no other instances --#
     all_config_entries = hass.config_entries.async_entries(domain=DOMAIN)
-    _LOGGER.debug(log_formatter.format("%i instances"), len(all_config_entries))
+    log_formatter.debug(_LOGGER, "%i instances", len(all_config_entries))
     if len(all_config_entries) == 1:
-        _LOGGER.debug(log_formatter.format("unregistering services"))
+        log_formatter.debug(_LOGGER, "unregistering services")
         config_entry.runtime_data.service_handler.unregister_services()
     # endregion
 
     # region #-- clean up the platforms --#
-    _LOGGER.debug(log_formatter.format("cleaning up platforms: %s"), _SETUP_PLATFORMS)
+    log_formatter.debug(_LOGGER, "cleaning up platforms: %s", _SETUP_PLATFORMS)
     ret = await hass.config_entries.async_unload_platforms(
         config_entry, _SETUP_PLATFORMS
     )
     # endregion
 
-    _LOGGER.debug(log_formatter.format("exited"))
+    log_formatter.debug(_LOGGER, "exited")
     return ret
 
 
+async def async_remove_entry(
+    hass: HomeAssistant, config_entry: LinksysVelopConfigEntry
+) -> None:
+    """Remove the stored data when the config entry is removed."""
+    await KnownDeviceStore(hass, config_entry.entry_id).async_remove()
+    await MeshSnapshotStore(hass, config_entry.entry_id).async_remove()
+
+
+@callback
+def _async_apply_options(
+    hass: HomeAssistant, config_entry: LinksysVelopConfigEntry, changed: set[str]
+) -> None:
+    """Apply the changed options to the running config entry."""
+    coordinators = config_entry.runtime_data.coordinators
+    mesh_coordinator: LinksysVelopUpdateCoordinator = coordinators[
+        CoordinatorTypes.MESH
+    ]
+
+    if CONF_API_REQUEST_TIMEOUT in changed:
+        mesh_coordinator.data.request_timeout = config_entry.options.get(
+            CONF_API_REQUEST_TIMEOUT, DEF_API_REQUEST_TIMEOUT
+        )
+
+    if changed.intersection(
+        (
+            CONF_ADAPTIVE_SCAN_INTERVAL,
+            CONF_SCAN_INTERVAL_MAX,
+            CONF_SCAN_INTERVAL_MIN,
+        )
+    ):
+        mesh_coordinator.adaptive_interval = _build_adaptive_interval(config_entry)
+        mesh_coordinator.set_normal_update_interval(
+            config_entry.options.get(CONF_SCAN_INTERVAL, DEF_SCAN_INTERVAL)
+        )
+
+    if CONF_SCAN_INTERVAL in changed:
+        for coordinator in coordinators.values():
+            coordinator.set_normal_update_interval(
+                config_entry.options.get(CONF_SCAN_INTERVAL, DEF_SCAN_INTERVAL)
+            )
+
+    if CONF_SCAN_INTERVAL_SLOW_TIER in changed:
+        mesh_coordinator.slow_tier_interval = timedelta(
+            seconds=config_entry.options.get(
+                CONF_SCAN_INTERVAL_SLOW_TIER, DEF_SCAN_INTERVAL_SLOW_TIER
+            )
+        )
+
+    if (
+        CONF_SCAN_INTERVAL_DEVICE_TRACKER in changed
+        and config_entry.runtime_data.device_tracker_timer is not None
+    ):
+        _async_start_device_tracker_timer(hass, config_entry)
+
+    # the consider home period and stale limits are read from the options
+    # when they are needed
+
+
 async def _async_update_listener(
-    hass: HomeAssistant, config_entry: ConfigEntry
+    hass: HomeAssistant, config_entry: LinksysVelopConfigEntry
 ) -> None:
-    """Reload the config entry."""
-    await hass.config_entries.async_reload(config_entry.entry_id)
+    """Apply the changed options.
+
+    Timers, intervals and timeouts are applied to the running config entry,
+    anything else reloads it.
+    """
+    log_formatter = Logger(unique_id=config_entry.unique_id)
+
+    previous_options: dict[str, Any] = config_entry.runtime_data.options
+    changed: set[str] = {
+        key
+        for key in previous_options.keys() | config_entry.options.keys()
+        if previous_options.get(key) != config_entry.options.get(key)
+    }.difference(_TRANSIENT_OPTIONS)
+    if changed.difference(_HOT_OPTIONS):
+        log_formatter.debug(_LOGGER, "reloading for options: %s", changed)
+        await hass.config_entries.async_reload(config_entry.entry_id)
+        return
+
+    log_formatter.debug(_LOGGER, "applying options: %s", changed)
+    _async_apply_options(hass, config_entry, changed)
+    config_entry.runtime_data.options = copy.deepcopy(dict(config_entry.options))
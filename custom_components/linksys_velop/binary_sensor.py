@@ -17,8 +17,15 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from pyvelop.node import Node
 
 from .coordinator import SpeedtestStatus, UpdateCoordinatorChangeableInterval
-from .entities import EntityDetails, EntityType, LinksysVelopEntity, build_entities
-from .types import CoordinatorTypes, LinksysVelopConfigEntry
+from .entities import (
+    EntityDetails,
+    EntityType,
+    LinksysVelopEntity,
+    async_add_entities_for_new_nodes,
+    build_entities,
+    get_entity_class,
+)
+from .types import CoordinatorTypes, LinksysVelopConfigEntry, PollTier
 
 # endregion
 
@@ -98,6 +105,7 @@ ENTITY_DETAILS: list[BinarySensorDetails] = [
             translation_key="status",
         ),
         entity_type=EntityType.DEVICE,
+        lean_core=True,
     ),
     # endregion
     # region #-- mesh sensors --#
@@ -122,6 +130,7 @@ ENTITY_DETAILS: list[BinarySensorDetails] = [
             translation_key="client_steering",
         ),
         entity_type=EntityType.MESH,
+        poll_tier=PollTier.SLOW,
     ),
     BinarySensorDetails(
         description=BinarySensorEntityDescription(
@@ -142,6 +151,7 @@ ENTITY_DETAILS: list[BinarySensorDetails] = [
             translation_key="express_forwarding",
         ),
         entity_type=EntityType.MESH,
+        poll_tier=PollTier.SLOW,
     ),
     BinarySensorDetails(
         description=BinarySensorEntityDescription(
@@ -152,6 +162,18 @@ ENTITY_DETAILS: list[BinarySensorDetails] = [
             translation_key="homekit_paired",
         ),
         entity_type=EntityType.MESH,
+        poll_tier=PollTier.SLOW,
+    ),
+    BinarySensorDetails(
+        description=BinarySensorEntityDescription(
+            device_class=BinarySensorDeviceClass.PROBLEM,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            key="is_stale",
+            name="Stale Data",
+            translation_key="stale",
+        ),
+        entity_type=EntityType.MESH,
+        esa_value_func=lambda m: {"failed_refreshes": m.failed_refreshes},
     ),
     BinarySensorDetails(
         description=BinarySensorEntityDescription(
@@ -162,6 +184,8 @@ ENTITY_DETAILS: list[BinarySensorDetails] = [
             translation_key="mac_filtering",
         ),
         entity_type=EntityType.MESH,
+        poll_tier=PollTier.SLOW,
+        esa_list_key="addresses",
         esa_value_func=lambda m: {
             "mode": m.mac_filtering_mode,
             "addresses": m.mac_filtering_addresses,
@@ -176,6 +200,7 @@ ENTITY_DETAILS: list[BinarySensorDetails] = [
             translation_key="node_steering",
         ),
         entity_type=EntityType.MESH,
+        poll_tier=PollTier.SLOW,
     ),
     BinarySensorDetails(
         description=BinarySensorEntityDescription(
@@ -186,6 +211,7 @@ ENTITY_DETAILS: list[BinarySensorDetails] = [
             translation_key="sip",
         ),
         entity_type=EntityType.MESH,
+        poll_tier=PollTier.SLOW,
     ),
     BinarySensorDetails(
         description=BinarySensorEntityDescription(
@@ -210,6 +236,7 @@ ENTITY_DETAILS: list[BinarySensorDetails] = [
             translation_key="upnp_allow_change_settings",
         ),
         entity_type=EntityType.MESH,
+        poll_tier=PollTier.SLOW,
     ),
     BinarySensorDetails(
         description=BinarySensorEntityDescription(
@@ -220,6 +247,7 @@ ENTITY_DETAILS: list[BinarySensorDetails] = [
             translation_key="upnp_allow_disable_internet",
         ),
         entity_type=EntityType.MESH,
+        poll_tier=PollTier.SLOW,
     ),
     BinarySensorDetails(
         description=BinarySensorEntityDescription(
@@ -230,6 +258,7 @@ ENTITY_DETAILS: list[BinarySensorDetails] = [
             translation_key="upnp",
         ),
         entity_type=EntityType.MESH,
+        poll_tier=PollTier.SLOW,
     ),
     BinarySensorDetails(
         description=BinarySensorEntityDescription(
@@ -240,6 +269,7 @@ ENTITY_DETAILS: list[BinarySensorDetails] = [
             translation_key="wan_status",
         ),
         entity_type=EntityType.MESH,
+        poll_tier=PollTier.SLOW,
         esa_value_func=lambda m: {
             "ip": m.wan_ip,
             "dns": m.wan_dns or None,
@@ -273,11 +303,29 @@ async def async_setup_entry(
     entities_to_add: list[LinksysVelopBinarySensor] = []
 
     entities = build_entities(ENTITY_DETAILS, config_entry, ENTITY_DOMAIN)
-    entities_to_add = [LinksysVelopBinarySensor(**entity) for entity in entities]
+    entities_to_add = [
+        get_entity_class(
+            config_entry,
+            entity["entity_details"],
+            LinksysVelopBinarySensor,
+            LinksysVelopBinarySensorUnrecordedList,
+        )(**entity)
+        for entity in entities
+    ]
 
     if len(entities_to_add) > 0:
         async_add_entities(entities_to_add)
 
+    async_add_entities_for_new_nodes(
+        hass,
+        config_entry,
+        ENTITY_DETAILS,
+        ENTITY_DOMAIN,
+        LinksysVelopBinarySensor,
+        async_add_entities,
+        LinksysVelopBinarySensorUnrecordedList,
+    )
+
 
 class LinksysVelopBinarySensor(LinksysVelopEntity, BinarySensorEntity):
     """Linksys Velop binary sensor."""
@@ -301,3 +349,11 @@ class LinksysVelopBinarySensor(LinksysVelopEntity, BinarySensorEntity):
                 self._attr_is_on = None
         else:
             self._attr_is_on = None
+
+
+class LinksysVelopBinarySensorUnrecordedList(LinksysVelopBinarySensor):
+    """Linksys Velop binary sensor whose attribute list isn't recorded."""
+
+    _unrecorded_attributes = frozenset(
+        entity.esa_list_key for entity in ENTITY_DETAILS if entity.esa_list_key
+    )
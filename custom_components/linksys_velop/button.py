@@ -14,7 +14,7 @@ from homeassistant.components.button import (
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from pyvelop.mesh import Mesh
+from pyvelop.mesh import JNAPActionMappings, Mesh
 from pyvelop.node import Node, NodeType
 
 from .const import (
@@ -23,11 +23,13 @@ from .const import (
     SIGNAL_UI_PLACEHOLDER_DEVICE_UPDATE,
     IntensiveTask,
 )
+from .coordinator import DEVICES_REFRESH_PROPS
 from .entities import (
     EntityContext,
     EntityDetails,
     EntityType,
     LinksysVelopEntity,
+    async_add_entities_for_new_nodes,
     build_entities,
 )
 from .helpers import remove_velop_entity_from_registry
@@ -42,6 +44,9 @@ _LOGGER: logging.Logger = logging.getLogger(__name__)
 class ButtonDetails(EntityDetails):
     description: ButtonEntityDescription
     press_func: Callable | str = field(kw_only=True)
+    refresh_props: JNAPActionMappings = field(
+        default=DEVICES_REFRESH_PROPS, kw_only=True
+    )
 
 
 async def _async_restart_primary_node(config_entry: LinksysVelopConfigEntry) -> None:
@@ -179,6 +184,15 @@ async def async_setup_entry(
     if len(entities_to_add) > 0:
         async_add_entities(entities_to_add)
 
+    async_add_entities_for_new_nodes(
+        hass,
+        config_entry,
+        ENTITY_DETAILS,
+        ENTITY_DOMAIN,
+        LinksysVelopButton,
+        async_add_entities,
+    )
+
 
 class LinksysVelopButton(LinksysVelopEntity, ButtonEntity):
     """Linksys Velop button."""
@@ -223,4 +237,10 @@ class LinksysVelopButton(LinksysVelopEntity, ButtonEntity):
             if hasattr(self, self._press_func):
                 await getattr(self, self._press_func)()
 
-        await self.coordinator.async_refresh()
+        # the mesh coordinator only needs the details changed by the press
+        if self._entity_details.coordinator_type == CoordinatorTypes.MESH:
+            await self.coordinator.async_refresh_scoped(
+                self._entity_details.refresh_props
+            )
+        else:
+            await self.coordinator.async_refresh()
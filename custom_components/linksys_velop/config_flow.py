@@ -32,29 +32,51 @@ from pyvelop.mesh import Mesh, Node
 
 from . import LinksysVelopConfigEntry
 from .const import (
+    CONF_ADAPTIVE_SCAN_INTERVAL,
     CONF_ALLOW_MESH_REBOOT,
     CONF_API_REQUEST_TIMEOUT,
+    CONF_ATTRIBUTES_MAX_ITEMS,
+    CONF_ATTRIBUTES_UNRECORDED,
     CONF_DEVICE_TRACKERS,
     CONF_DEVICE_TRACKERS_TO_REMOVE,
+    CONF_EVENTS_BULK_THRESHOLD,
     CONF_EVENTS_OPTIONS,
     CONF_FLOW_NAME,
     CONF_NODE,
     CONF_NODE_IMAGES,
     CONF_SCAN_INTERVAL_DEVICE_TRACKER,
+    CONF_SCAN_INTERVAL_MAX,
+    CONF_SCAN_INTERVAL_MIN,
+    CONF_SCAN_INTERVAL_SLOW_TIER,
     CONF_SELECT_TEMP_UI_DEVICE,
+    CONF_STALE_MAX_AGE,
+    CONF_STALE_MAX_FAILURES,
     CONF_TITLE_PLACEHOLDERS,
     CONF_UI_DEVICES,
+    CONF_UI_DEVICES_LEAN,
+    CONF_UI_DEVICES_LEAN_CHANGED,
     CONF_UI_DEVICES_TO_REMOVE,
+    DEF_ADAPTIVE_SCAN_INTERVAL,
     DEF_ALLOW_MESH_REBOOT,
     DEF_API_REQUEST_TIMEOUT,
+    DEF_ATTRIBUTES_MAX_ITEMS,
+    DEF_ATTRIBUTES_UNRECORDED,
     DEF_CONSIDER_HOME,
+    DEF_EVENTS_BULK_THRESHOLD,
     DEF_EVENTS_OPTIONS,
     DEF_FLOW_NAME,
     DEF_SCAN_INTERVAL,
     DEF_SCAN_INTERVAL_DEVICE_TRACKER,
+    DEF_SCAN_INTERVAL_MAX,
+    DEF_SCAN_INTERVAL_MIN,
+    DEF_SCAN_INTERVAL_SLOW_TIER,
     DEF_SELECT_TEMP_UI_DEVICE,
+    DEF_STALE_MAX_AGE,
+    DEF_STALE_MAX_FAILURES,
+    DEF_UI_DEVICES_LEAN,
     DEF_UI_PLACEHOLDER_DEVICE_ID,
     DOMAIN,
+    EVENTS_OPTIONS,
     ST_IGD,
 )
 from .logger import Logger
@@ -94,6 +116,16 @@ def _is_mesh_by_host(hass: HomeAssistant, host: str) -> LinksysVelopConfigEntry
     return None
 
 
+def _validate_timers(user_input: dict) -> dict[str, str]:
+    """Check that the adaptive scan interval range is valid."""
+    if user_input.get(CONF_SCAN_INTERVAL_MIN, DEF_SCAN_INTERVAL_MIN) > user_input.get(
+        CONF_SCAN_INTERVAL_MAX, DEF_SCAN_INTERVAL_MAX
+    ):
+        return {CONF_SCAN_INTERVAL_MAX: "scan_interval_range"}
+
+    return {}
+
+
 async def _async_build_schema_with_user_input(
     step: str, user_input: dict, **kwargs
 ) -> vol.Schema:
@@ -124,6 +156,23 @@ async def _async_build_schema_with_user_input(
                         CONF_ALLOW_MESH_REBOOT, DEF_ALLOW_MESH_REBOOT
                     ),
                 ): selector.BooleanSelector(),
+                vol.Required(
+                    CONF_ATTRIBUTES_MAX_ITEMS,
+                    default=user_input.get(
+                        CONF_ATTRIBUTES_MAX_ITEMS, DEF_ATTRIBUTES_MAX_ITEMS
+                    ),
+                ): selector.NumberSelector(
+                    config=selector.NumberSelectorConfig(
+                        min=0,
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Required(
+                    CONF_ATTRIBUTES_UNRECORDED,
+                    default=user_input.get(
+                        CONF_ATTRIBUTES_UNRECORDED, DEF_ATTRIBUTES_UNRECORDED
+                    ),
+                ): selector.BooleanSelector(),
             }
         )
     elif step == Steps.DEVICE_TRACKERS:
@@ -158,10 +207,21 @@ async def _async_build_schema_with_user_input(
                     config=selector.SelectSelectorConfig(
                         mode=selector.SelectSelectorMode.DROPDOWN,
                         multiple=True,
-                        options=DEF_EVENTS_OPTIONS,
+                        options=EVENTS_OPTIONS,
                         translation_key=CONF_EVENTS_OPTIONS,
                     )
-                )
+                ),
+                vol.Required(
+                    CONF_EVENTS_BULK_THRESHOLD,
+                    default=user_input.get(
+                        CONF_EVENTS_BULK_THRESHOLD, DEF_EVENTS_BULK_THRESHOLD
+                    ),
+                ): selector.NumberSelector(
+                    config=selector.NumberSelectorConfig(
+                        min=1,
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
             }
         )
     elif step == Steps.REAUTH_CONFIRM:
@@ -188,6 +248,34 @@ async def _async_build_schema_with_user_input(
                         mode=selector.NumberSelectorMode.BOX,
                     )
                 ),
+                vol.Required(
+                    CONF_ADAPTIVE_SCAN_INTERVAL,
+                    default=user_input.get(
+                        CONF_ADAPTIVE_SCAN_INTERVAL, DEF_ADAPTIVE_SCAN_INTERVAL
+                    ),
+                ): selector.BooleanSelector(),
+                vol.Required(
+                    CONF_SCAN_INTERVAL_MIN,
+                    default=user_input.get(
+                        CONF_SCAN_INTERVAL_MIN, DEF_SCAN_INTERVAL_MIN
+                    ),
+                ): selector.NumberSelector(
+                    config=selector.NumberSelectorConfig(
+                        min=1,
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Required(
+                    CONF_SCAN_INTERVAL_MAX,
+                    default=user_input.get(
+                        CONF_SCAN_INTERVAL_MAX, DEF_SCAN_INTERVAL_MAX
+                    ),
+                ): selector.NumberSelector(
+                    config=selector.NumberSelectorConfig(
+                        min=1,
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
                 vol.Required(
                     CONF_SCAN_INTERVAL_DEVICE_TRACKER,
                     default=user_input.get(
@@ -200,6 +288,17 @@ async def _async_build_schema_with_user_input(
                         mode=selector.NumberSelectorMode.BOX,
                     )
                 ),
+                vol.Required(
+                    CONF_SCAN_INTERVAL_SLOW_TIER,
+                    default=user_input.get(
+                        CONF_SCAN_INTERVAL_SLOW_TIER, DEF_SCAN_INTERVAL_SLOW_TIER
+                    ),
+                ): selector.NumberSelector(
+                    config=selector.NumberSelectorConfig(
+                        min=0,
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
                 vol.Required(
                     CONF_CONSIDER_HOME,
                     default=user_input.get(CONF_CONSIDER_HOME, DEF_CONSIDER_HOME),
@@ -215,6 +314,26 @@ async def _async_build_schema_with_user_input(
                         CONF_API_REQUEST_TIMEOUT, DEF_API_REQUEST_TIMEOUT
                     ),
                 ): cv.positive_float,
+                vol.Required(
+                    CONF_STALE_MAX_FAILURES,
+                    default=user_input.get(
+                        CONF_STALE_MAX_FAILURES, DEF_STALE_MAX_FAILURES
+                    ),
+                ): selector.NumberSelector(
+                    config=selector.NumberSelectorConfig(
+                        min=0,
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Required(
+                    CONF_STALE_MAX_AGE,
+                    default=user_input.get(CONF_STALE_MAX_AGE, DEF_STALE_MAX_AGE),
+                ): selector.NumberSelector(
+                    config=selector.NumberSelectorConfig(
+                        min=0,
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
             }
         )
     elif step == Steps.UI_DEVICE:
@@ -236,7 +355,11 @@ async def _async_build_schema_with_user_input(
                             for value, label in kwargs["multi_select_contents"].items()
                         ],
                     )
-                )
+                ),
+                vol.Required(
+                    CONF_UI_DEVICES_LEAN,
+                    default=user_input.get(CONF_UI_DEVICES_LEAN, DEF_UI_DEVICES_LEAN),
+                ): selector.BooleanSelector(),
             }
         )
     elif step == Steps.USER:
@@ -302,60 +425,60 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def _set_error(self, exc: MeshException) -> None:
         """Set the error for the flow based on the exception received."""
         if isinstance(exc, MeshConnectionError):
-            _LOGGER.debug(self._log_formatter.format("connection error"))
+            self._log_formatter.debug(_LOGGER, "connection error")
             self._errors["base"] = "connection_error"
         elif (exc, MeshBadResponse):
-            _LOGGER.debug(self._log_formatter.format("bad response"))
+            self._log_formatter.debug(_LOGGER, "bad response")
             self._errors["base"] = "login_bad_response"
         elif (exc, MeshInvalidInput):
-            _LOGGER.debug(self._log_formatter.format("invalid input"))
+            self._log_formatter.debug(_LOGGER, "invalid input")
             _LOGGER.warning("%s", exc)
             self._errors["base"] = "invalid_input"
         elif (exc, MeshNodeNotPrimary):
-            _LOGGER.debug(self._log_formatter.format("not primary"))
+            self._log_formatter.debug(_LOGGER, "not primary")
             self._errors["base"] = "node_not_primary"
         elif (exc, MeshTimeoutError):
-            _LOGGER.debug(self._log_formatter.format("timeout"))
+            self._log_formatter.debug(_LOGGER, "timeout")
             self._errors["base"] = "node_timeout"
 
     async def _async_task_gather_details(self) -> None:
         """Gather the details about the Mesh."""
-        _LOGGER.debug(self._log_formatter.format("entered"))
+        self._log_formatter.debug(_LOGGER, "entered")
         try:
             await self._mesh.async_gather_details()
         except MeshException as exc:
             self._set_error(exc)
         else:
-            _LOGGER.debug(self._log_formatter.format("no exceptions"))
+            self._log_formatter.debug(_LOGGER, "no exceptions")
 
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        self._log_formatter.debug(_LOGGER, "exited")
 
     async def _async_task_login(self, details) -> None:
         """Test the credentials for the Mesh."""
-        _LOGGER.debug(self._log_formatter.format("entered, details: %s"), details)
+        self._log_formatter.debug(_LOGGER, "entered, details: %s", details)
         _mesh = Mesh(**details, session=async_get_clientsession(hass=self.hass))
         try:
-            _LOGGER.debug(self._log_formatter.format("testing credentials"))
+            self._log_formatter.debug(_LOGGER, "testing credentials")
             valid: bool = await _mesh.async_test_credentials()
-            _LOGGER.debug(self._log_formatter.format("credentials tested"))
+            self._log_formatter.debug(_LOGGER, "credentials tested")
             if not valid:
-                _LOGGER.debug(self._log_formatter.format("credentials are not valid"))
+                self._log_formatter.debug(_LOGGER, "credentials are not valid")
                 self._errors["base"] = "login_error"
             else:
-                _LOGGER.debug(self._log_formatter.format("credentials are valid"))
+                self._log_formatter.debug(_LOGGER, "credentials are valid")
                 self._mesh = _mesh
         except MeshException as exc:
             self._set_error(exc)
         else:
-            _LOGGER.debug(self._log_formatter.format("no exceptions"))
+            self._log_formatter.debug(_LOGGER, "no exceptions")
 
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        self._log_formatter.debug(_LOGGER, "exited")
 
     async def async_step_device_trackers(
         self, user_input=None
     ) -> data_entry_flow.FlowResult:
         """Allow the user to select the device trackers for presence detection."""
-        _LOGGER.debug(self._log_formatter.format("entered, user_input: %s"), user_input)
+        self._log_formatter.debug(_LOGGER, "entered, user_input: %s", user_input)
         if user_input is not None:
             self._errors = {}
             self._options.update(user_input)
@@ -374,7 +497,7 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_finish(self) -> data_entry_flow.FlowResult:
         """Finalise the configuration entry."""
-        _LOGGER.debug(self._log_formatter.format("entered"))
+        self._log_formatter.debug(_LOGGER, "entered")
         _title = (
             self.context.get(CONF_TITLE_PLACEHOLDERS, {}).get(CONF_FLOW_NAME)
             or DEF_FLOW_NAME
@@ -385,23 +508,21 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, user_input=None
     ) -> data_entry_flow.FlowResult:
         """Initiate gathering Mesh details."""
-        _LOGGER.debug(self._log_formatter.format("entered, user_input: %s"), user_input)
+        self._log_formatter.debug(_LOGGER, "entered, user_input: %s", user_input)
 
         if self.task_gather is None:
-            _LOGGER.debug(
-                self._log_formatter.format("creating task for gathering details")
-            )
+            self._log_formatter.debug(_LOGGER, "creating task for gathering details")
             self.task_gather = self.hass.async_create_task(
                 self._async_task_gather_details()
             )
 
         if self.task_gather.done():
-            _LOGGER.debug(self._log_formatter.format("_errors: %s"), self._errors)
+            self._log_formatter.debug(_LOGGER, "_errors: %s", self._errors)
             next_step: str = Steps.TIMERS
             if self._errors:
                 next_step = Steps.USER
 
-            _LOGGER.debug(self._log_formatter.format("next step: %s"), next_step)
+            self._log_formatter.debug(_LOGGER, "next step: %s", next_step)
             return self.async_show_progress_done(next_step_id=next_step)
 
         return self.async_show_progress(
@@ -412,10 +533,10 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_login(self, user_input=None) -> data_entry_flow.FlowResult:
         """Initiate the credential test."""
-        _LOGGER.debug(self._log_formatter.format("entered, user_input: %s"), user_input)
+        self._log_formatter.debug(_LOGGER, "entered, user_input: %s", user_input)
 
         if self.task_login is None:
-            _LOGGER.debug(self._log_formatter.format("creating credential test task"))
+            self._log_formatter.debug(_LOGGER, "creating credential test task")
             details: dict = {
                 "node": self._options.get(CONF_NODE),
                 "password": self._options.get(CONF_PASSWORD),
@@ -426,12 +547,12 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             )
 
         if self.task_login.done():
-            _LOGGER.debug(self._log_formatter.format("_errors: %s"), self._errors)
+            self._log_formatter.debug(_LOGGER, "_errors: %s", self._errors)
             next_step: str = Steps.GATHER_DETAILS
             if self._errors:
                 next_step = Steps.USER
 
-            _LOGGER.debug(self._log_formatter.format("next step: %s"), next_step)
+            self._log_formatter.debug(_LOGGER, "next step: %s", next_step)
             return self.async_show_progress_done(next_step_id=next_step)
 
         return self.async_show_progress(
@@ -473,8 +594,8 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, discovery_info: SsdpServiceInfo
     ) -> data_entry_flow.FlowResult:
         """Allow the Mesh primary node to be discovered via SSDP."""
-        _LOGGER.debug(
-            self._log_formatter.format("entered, discovery_info: %s"), discovery_info
+        self._log_formatter.debug(
+            _LOGGER, "entered, discovery_info: %s", discovery_info
         )
 
         # region #-- get the important info --#
@@ -487,7 +608,7 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         # region #-- check for a valid Velop device --#
         if "velop" not in _model_description.lower():
-            _LOGGER.debug(self._log_formatter.format("not a Velop model"))
+            self._log_formatter.debug(_LOGGER, "not a Velop model")
             return self.async_abort(reason="not_velop")
         # endregion
 
@@ -500,13 +621,11 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
         if matching_entry:
             if not matching_entry.unique_id:  # no unique_id even though the host exists
-                _LOGGER.debug(
-                    self._log_formatter.format("no unique_id in the config entry")
-                )
+                self._log_formatter.debug(_LOGGER, "no unique_id in the config entry")
                 update_unique_id = True
             elif matching_entry.unique_id != _serial:  # parent node changed?
-                _LOGGER.debug(
-                    self._log_formatter.format("assuming the primary node has changed")
+                self._log_formatter.debug(
+                    _LOGGER, "assuming the primary node has changed"
                 )
                 update_unique_id = True
 
@@ -527,7 +646,7 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     )
 
         if update_unique_id:
-            _LOGGER.debug(self._log_formatter.format("updating unique_id"))
+            self._log_formatter.debug(_LOGGER, "updating unique_id")
             if self.hass.config_entries.async_update_entry(
                 entry=matching_entry, unique_id=_serial
             ):
@@ -536,7 +655,7 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # endregion
 
         # region #-- set a unique_id, update details if device has changed IP --#
-        _LOGGER.debug(self._log_formatter.format("setting unique_id"))
+        self._log_formatter.debug(_LOGGER, "setting unique_id")
         await self.async_set_unique_id(_serial)
         self._abort_if_unique_id_configured(updates={CONF_NODE: _host})
         # endregion
@@ -550,16 +669,18 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_timers(self, user_input=None) -> data_entry_flow.FlowResult:
         """Allow the user to set the relevant timers for the integration."""
-        _LOGGER.debug(self._log_formatter.format("entered, user_input: %s"), user_input)
+        self._log_formatter.debug(_LOGGER, "entered, user_input: %s", user_input)
         if user_input is not None:
-            self._errors = {}
-            self._options[CONF_API_REQUEST_TIMEOUT] = DEF_API_REQUEST_TIMEOUT
+            self._errors = _validate_timers(user_input)
+            if not self._errors:
+                self._options[CONF_API_REQUEST_TIMEOUT] = DEF_API_REQUEST_TIMEOUT
+                self._options.update(user_input)
+                return await self.async_step_device_trackers()
             self._options.update(user_input)
-            return await self.async_step_device_trackers()
 
         # region #-- handle the unique_id now --#
         if not self.unique_id:
-            _LOGGER.debug(self._log_formatter.format("no unique_id"))
+            self._log_formatter.debug(_LOGGER, "no unique_id")
             # region #-- get the unique_id --#
             unique_id: str | None = None
             if self._mesh:
@@ -576,15 +697,15 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             )
             if matching_entry:
                 if not matching_entry.unique_id:
-                    _LOGGER.debug(
-                        self._log_formatter.format("updating config entry unique_id")
+                    self._log_formatter.debug(
+                        _LOGGER, "updating config entry unique_id"
                     )
                     self.hass.config_entries.async_update_entry(
                         entry=matching_entry, unique_id=unique_id
                     )
                 return self.async_abort(reason="already_configured")
             else:
-                _LOGGER.debug(self._log_formatter.format("setting unique_id"))
+                self._log_formatter.debug(_LOGGER, "setting unique_id")
                 await self.async_set_unique_id(unique_id, raise_on_progress=False)
                 self._abort_if_unique_id_configured()
             # endregion
@@ -601,7 +722,7 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_unignore(self, user_input=None) -> data_entry_flow.FlowResult:
         """Rediscover the devices if the config entry is being unignored."""
-        _LOGGER.debug(self._log_formatter.format("entered, user_input: %s"), user_input)
+        self._log_formatter.debug(_LOGGER, "entered, user_input: %s", user_input)
 
         # region #-- get the original unique_id --#
         unique_id = user_input.get("unique_id")
@@ -623,7 +744,7 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         ]
 
         if not device_info:
-            _LOGGER.debug(self._log_formatter.format("device not found"))
+            self._log_formatter.debug(_LOGGER, "device not found")
             return self.async_abort(reason="not_found")
         # endregion
 
@@ -631,7 +752,7 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_user(self, user_input=None) -> data_entry_flow.FlowResult:
         """Handle a flow initiated by the user."""
-        _LOGGER.debug(self._log_formatter.format("entered, user_input: %s"), user_input)
+        self._log_formatter.debug(_LOGGER, "entered, user_input: %s", user_input)
 
         if user_input is not None:
             self.task_login = None
@@ -665,7 +786,7 @@ class LinksysOptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input=None
     ) -> data_entry_flow.FlowResult:
         """Manage the advanced options for the configuration."""
-        _LOGGER.debug(self._log_formatter.format("entered, user_input: %s"), user_input)
+        self._log_formatter.debug(_LOGGER, "entered, user_input: %s", user_input)
 
         if user_input is not None:
             if user_input.get(CONF_NODE_IMAGES) == "*":
@@ -686,7 +807,7 @@ class LinksysOptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input=None
     ) -> data_entry_flow.FlowResult:
         """Manage the device trackers."""
-        _LOGGER.debug(self._log_formatter.format("entered, user_input: %s"), user_input)
+        self._log_formatter.debug(_LOGGER, "entered, user_input: %s", user_input)
 
         if user_input is not None:
             self._options.update(user_input)
@@ -713,7 +834,7 @@ class LinksysOptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_events(self, user_input=None) -> data_entry_flow.FlowResult:
         """Event options."""
-        _LOGGER.debug(self._log_formatter.format("entered, user_input: %s"), user_input)
+        self._log_formatter.debug(_LOGGER, "entered, user_input: %s", user_input)
 
         if user_input is not None:
             self._options.update(user_input)
@@ -732,7 +853,7 @@ class LinksysOptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_finalise(self, user_input=None) -> data_entry_flow.FlowResult:
         """Run the final pieces of the flow."""
-        _LOGGER.debug(self._log_formatter.format("entered, user_input: %s"), user_input)
+        self._log_formatter.debug(_LOGGER, "entered, user_input: %s", user_input)
 
         # region #-- set device trackers no longer required to be removed --#
         prev_trackers: set[str] = set(
@@ -757,6 +878,15 @@ class LinksysOptionsFlowHandler(config_entries.OptionsFlow):
             )
         # endregion
 
+        # region #-- set the entities to update if lean mode has changed --#
+        if self._config_entry.options.get(
+            CONF_UI_DEVICES_LEAN, DEF_UI_DEVICES_LEAN
+        ) != self._options.get(CONF_UI_DEVICES_LEAN, DEF_UI_DEVICES_LEAN):
+            self._options[CONF_UI_DEVICES_LEAN_CHANGED] = True
+        else:
+            self._options.pop(CONF_UI_DEVICES_LEAN_CHANGED, None)
+        # endregion
+
         # region #-- add the placeholder ui device if needed --#
         if self._options.get(CONF_SELECT_TEMP_UI_DEVICE):
             if DEF_UI_PLACEHOLDER_DEVICE_ID not in self._options.get(
@@ -788,10 +918,9 @@ class LinksysOptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_init(self, user_input=None) -> data_entry_flow.FlowResult:
         """First Step."""
-        _LOGGER.debug(self._log_formatter.format("entered, user_input: %s"), user_input)
-        _LOGGER.debug(
-            self._log_formatter.format("show advanced options: %s"),
-            self.show_advanced_options,
+        self._log_formatter.debug(_LOGGER, "entered, user_input: %s", user_input)
+        self._log_formatter.debug(
+            _LOGGER, "show advanced options: %s", self.show_advanced_options
         )
 
         menu_options: list[str] = [
@@ -810,7 +939,7 @@ class LinksysOptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_timers(self, user_input=None) -> data_entry_flow.FlowResult:
         """Manage the timer options available for the integration."""
-        _LOGGER.debug(self._log_formatter.format("entered, user_input: %s"), user_input)
+        self._log_formatter.debug(_LOGGER, "entered, user_input: %s", user_input)
 
         if user_input is not None:
             # TODO: This can be removed after a length of time but it does no harm
@@ -821,7 +950,9 @@ class LinksysOptionsFlowHandler(config_entries.OptionsFlow):
             if CONF_API_REQUEST_TIMEOUT not in self._options:
                 self._options[CONF_API_REQUEST_TIMEOUT] = DEF_API_REQUEST_TIMEOUT
             self._options.update(user_input)
-            return await self.async_step_device_trackers()
+            self._errors = _validate_timers(user_input)
+            if not self._errors:
+                return await self.async_step_device_trackers()
 
         return self.async_show_form(
             step_id=Steps.TIMERS,
@@ -834,7 +965,7 @@ class LinksysOptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_ui_device(self, user_input=None) -> data_entry_flow.FlowResult:
         """Manage the devices that should be created in the UI."""
-        _LOGGER.debug(self._log_formatter.format("entered, user_input: %s"), user_input)
+        self._log_formatter.debug(_LOGGER, "entered, user_input: %s", user_input)
 
         if user_input is not None:
             self._options.update(user_input)
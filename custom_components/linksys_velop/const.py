@@ -20,32 +20,72 @@ from .types import EventSubTypes
 
 DOMAIN: str = "linksys_velop"
 
+CONF_ADAPTIVE_SCAN_INTERVAL: str = "adaptive_scan_interval"
 CONF_ALLOW_MESH_REBOOT: str = "allow_mesh_reboot"
 CONF_API_REQUEST_TIMEOUT: str = "api_request_timeout"
+CONF_ATTRIBUTES_MAX_ITEMS: str = "attributes_max_items"
+CONF_ATTRIBUTES_UNRECORDED: str = "attributes_unrecorded"
 CONF_DEVICE_TRACKERS: str = "tracked"
 CONF_DEVICE_TRACKERS_TO_REMOVE: str = "tracked_to_remove"
+CONF_EVENTS_BULK_THRESHOLD: str = "events_bulk_threshold"
 CONF_EVENTS_OPTIONS: str = "events_options"
 CONF_FLOW_NAME: str = "name"
 CONF_NODE: str = "node"
 CONF_NODE_IMAGES: str = "node_images"
 CONF_SCAN_INTERVAL_DEVICE_TRACKER: str = "scan_interval_device_tracker"
+CONF_SCAN_INTERVAL_MAX: str = "scan_interval_max"
+CONF_SCAN_INTERVAL_MIN: str = "scan_interval_min"
+CONF_SCAN_INTERVAL_SLOW_TIER: str = "scan_interval_slow_tier"
 CONF_SELECT_TEMP_UI_DEVICE: str = "select_temp_ui_device"
+CONF_STALE_MAX_AGE: str = "stale_max_age"
+CONF_STALE_MAX_FAILURES: str = "stale_max_failures"
 CONF_TITLE_PLACEHOLDERS: str = "title_placeholders"
 CONF_UI_DEVICES_TO_REMOVE: str = "ui_devices_to_remove"
 CONF_UI_DEVICES: str = "ui_devices"
+CONF_UI_DEVICES_LEAN: str = "ui_devices_lean"
+CONF_UI_DEVICES_LEAN_CHANGED: str = "ui_devices_lean_changed"
 
+DEF_ADAPTIVE_SCAN_INTERVAL: bool = False
 DEF_ALLOW_MESH_REBOOT: bool = False
 DEF_API_REQUEST_TIMEOUT: int = 10
+# 0 means the lists in the attributes aren't capped
+DEF_ATTRIBUTES_MAX_ITEMS: int = 0
+DEF_ATTRIBUTES_UNRECORDED: bool = False
 DEF_CHANNEL_SCAN_PROGRESS_INTERVAL_SECS: float = 40
 DEF_CONSIDER_HOME: int = 180
-DEF_EVENTS_OPTIONS: list[str] = [ev.value for ev in EventSubTypes]
+DEF_EVENTS_BULK_THRESHOLD: int = 10
+# the device events can be raised for every device so have to be selected
+DEF_EVENTS_OPTIONS: list[str] = [
+    EventSubTypes.NEW_DEVICE_FOUND.value,
+    EventSubTypes.NEW_NODE_FOUND.value,
+    EventSubTypes.NODE_REMOVED.value,
+]
 DEF_FLOW_NAME: str = "Linksys Velop Mesh"
 DEF_SCAN_INTERVAL: int = 60
 DEF_SCAN_INTERVAL_DEVICE_TRACKER: int = 10
+DEF_SCAN_INTERVAL_MAX: int = 300
+DEF_SCAN_INTERVAL_MIN: int = 15
+DEF_SCAN_INTERVAL_SLOW_TIER: int = 900
 DEF_SELECT_TEMP_UI_DEVICE: bool = False
+DEF_STALE_MAX_AGE: int = 600
+DEF_STALE_MAX_FAILURES: int = 0
+DEF_STALE_RETRY_INTERVAL_SECS: float = 5
 DEF_SPEEDTEST_PROGRESS_INTERVAL_SECS: float = 1
+DEF_UI_DEVICES_LEAN: bool = False
 DEF_UI_PLACEHOLDER_DEVICE_ID: str = str(uuid.UUID(int=0))
 
+BULK_SERVICES_CONCURRENCY: int = 4
+KNOWN_DEVICES_EXPIRY_DAYS: int = 90
+KNOWN_DEVICES_SAVE_INTERVAL_SECS: int = 3600
+# bulk events are raised in place of the selected events so aren't an option
+EVENTS_OPTIONS: list[str] = [
+    ev.value for ev in EventSubTypes if ev != EventSubTypes.BULK_EVENTS
+]
+EVENTS_QUEUE_SIZE: int = 100
+SNAPSHOT_SAVE_DELAY_SECS: int = 30
+STORAGE_VERSION: int = 1
+SWITCH_CONFIRM_DELAY_SECS: float = 3
+
 ISSUE_MISSING_DEVICE_TRACKER: str = "missing_device_tracker"
 ISSUE_MISSING_NODE: str = "missing_node"
 ISSUE_MISSING_UI_DEVICE: str = "missing_ui_device"
@@ -66,7 +106,7 @@ except PackageNotFoundError:
     pass
 
 
-SIGNAL_DEVICE_TRACKER_UPDATE: str = f"{DOMAIN}_device_tracker_update"
+SIGNAL_NEW_NODES: str = f"{DOMAIN}_new_nodes"
 SIGNAL_UI_PLACEHOLDER_DEVICE_UPDATE: str = f"{DOMAIN}_ui_placeholder_update"
 
 ST_IGD: str = "urn:schemas-upnp-org:device:InternetGatewayDevice:2"
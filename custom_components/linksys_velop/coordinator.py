@@ -3,13 +3,16 @@
 # region #-- imports --#
 import asyncio
 import copy
+import json
 import logging
+import time
 from dataclasses import dataclass
 from datetime import timedelta
 from enum import StrEnum, auto
+from itertools import chain
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.device_registry import DeviceEntry, DeviceRegistry
@@ -18,33 +21,134 @@ from homeassistant.helpers.issue_registry import IssueSeverity
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import slugify
 from pyvelop.device import Device
-from pyvelop.exceptions import MeshNeedsGatherDetails, MeshTimeoutError
-from pyvelop.mesh import Mesh
+from pyvelop.exceptions import MeshTimeoutError
+from pyvelop.mesh import JNAPActionMappings, Mesh
 from pyvelop.node import Node
 
 from .const import (
     CONF_API_REQUEST_TIMEOUT,
+    CONF_EVENTS_BULK_THRESHOLD,
     CONF_EVENTS_OPTIONS,
+    CONF_STALE_MAX_AGE,
+    CONF_STALE_MAX_FAILURES,
     CONF_UI_DEVICES,
     DEF_API_REQUEST_TIMEOUT,
     DEF_CHANNEL_SCAN_PROGRESS_INTERVAL_SECS,
+    DEF_EVENTS_BULK_THRESHOLD,
     DEF_EVENTS_OPTIONS,
     DEF_SPEEDTEST_PROGRESS_INTERVAL_SECS,
+    DEF_STALE_MAX_AGE,
+    DEF_STALE_MAX_FAILURES,
+    DEF_STALE_RETRY_INTERVAL_SECS,
     DEF_UI_PLACEHOLDER_DEVICE_ID,
     DOMAIN,
     ISSUE_MISSING_NODE,
     ISSUE_MISSING_UI_DEVICE,
+    SIGNAL_NEW_NODES,
     IntensiveTask,
 )
+from .diff import MeshChange, MeshDiffer
 from .exceptions import CoordinatorMeshTimeout, GeneralException
 from .logger import Logger
-from .types import EventSubTypes, LinksysVelopConfigEntry
+from .mesh import DerivedMeshData, LinksysVelopMesh
+from .types import (
+    EventSubTypes,
+    LinksysVelopConfigEntry,
+    MeshChangeType,
+    PollTier,
+)
 
 # endregion
 
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# the devices and nodes are rebuilt from these on every refresh, so all are
+# needed for them to be complete
+_FAST_TIER_PROPS: JNAPActionMappings = (
+    JNAPActionMappings.GET_BACKHAUL
+    | JNAPActionMappings.GET_DEVICES
+    | JNAPActionMappings.GET_LAN_SETTINGS
+    | JNAPActionMappings.GET_NETWORK_CONNECTIONS
+    | JNAPActionMappings.GET_PARENTAL_CONTROL_INFO
+    | JNAPActionMappings.GET_UPDATE_FIRMWARE_STATE
+)
+
+# the devices and nodes are built from all of these details, so a scoped
+# refresh that changes the devices must gather them all
+DEVICES_REFRESH_PROPS: JNAPActionMappings = _FAST_TIER_PROPS
+
+_FINGERPRINT_IGNORE: set[int | str] = {
+    "devices",
+    "results_time",
+    JNAPActionMappings.GET_DEVICES.value,
+}
+
+
+def _fingerprint(obj: Device | Mesh | Node) -> int:
+    """Build a comparable fingerprint for the given object.
+
+    The raw attributes are used, so anything that changes the value of a
+    property will change the fingerprint.  The time the results were
+    retrieved is ignored as that changes on every poll.  Devices are
+    fingerprinted individually so are ignored for the Mesh.
+
+    N.B. the Mesh attributes are keyed on the JNAP action mappings, which
+    are ints, so the keys are converted to str to allow them to be sorted.
+    """
+    attributes: dict[str, Any]
+    if isinstance(obj, Mesh):
+        attributes = {
+            "is_stale": getattr(obj, "is_stale", False),
+            "scan_interval": getattr(obj, "scan_interval", None),
+        } | {
+            str(key): value
+            for key, value in getattr(obj, "_mesh_attributes", {}).items()
+            if key not in _FINGERPRINT_IGNORE
+        }
+    else:
+        attributes = {
+            key: value
+            for key, value in getattr(obj, "_attribs", {}).items()
+            if key not in _FINGERPRINT_IGNORE
+        }
+        if isinstance(obj, Node):
+            attributes["connected_devices"] = obj.connected_devices
+            attributes["parent_name"] = obj.parent_name
+
+    return hash(json.dumps(attributes, default=str, sort_keys=True))
+
+
+def _event_for_change(change: MeshChange) -> tuple[EventSubTypes, tuple] | None:
+    """Establish the event, and the details to send with it, for a change.
+
+    New devices and nodes are established separately, as they must be new to
+    the mesh rather than just to the last refresh.
+    """
+    if change.change_type == MeshChangeType.ADDED:
+        return None
+
+    if change.is_node:
+        if change.change_type == MeshChangeType.REMOVED:
+            return EventSubTypes.NODE_REMOVED, (change.previous,)
+        return None
+
+    if change.change_type == MeshChangeType.STATUS:
+        if change.new_value:
+            return EventSubTypes.DEVICE_ONLINE, (change.current,)
+        return EventSubTypes.DEVICE_OFFLINE, (change.current,)
+
+    # a device that has gone offline or come online isn't roaming
+    if (
+        change.change_type == MeshChangeType.PARENT
+        and change.current.status
+        and change.new_value is not None
+        and change.old_value is not None
+    ):
+        return EventSubTypes.DEVICE_ROAMED, (change.current, change.old_value)
+
+    return None
+
 
 class SpeedtestStatus(StrEnum):
     """"""
@@ -85,54 +189,393 @@ class SpeedtestResults(DataCoordinatorFormattedData):
     upload_bandwidth: int
 
 
+class AdaptiveInterval:
+    """Adapt the interval between refreshes to what is happening on the mesh.
+
+    The interval is halved when devices join, leave or change status and is
+    backed off after several refreshes in a row without any.  It is also
+    backed off when the time taken to gather the details climbs well above
+    its usual level, as that suggests the router is busy.
+    """
+
+    BACKOFF_FACTOR: float = 1.5
+    LATENCY_ALPHA: float = 0.3
+    LATENCY_BASELINE_ALPHA: float = 0.05
+    LATENCY_THRESHOLD: float = 2
+    QUIET_REFRESHES: int = 3
+
+    def __init__(self, min_secs: float, max_secs: float) -> None:
+        """Initialise."""
+        self.max_secs: float = max_secs
+        self.min_secs: float = min_secs
+
+        self._latency: dict[str, float] = {}
+        self._latency_baseline: dict[str, float] = {}
+        self._quiet_refreshes: int = 0
+
+    def _is_loaded(self, latency: float, latency_key: str) -> bool:
+        """Update the average latency and establish if it has climbed.
+
+        Latencies are tracked separately for each key so that refreshes that
+        gather different amounts of details aren't compared.  The baseline
+        follows the average down straight away but up only slowly, so a lasting
+        rise, e.g. from more devices on the mesh, stops counting as load.
+        """
+        average: float = self._latency.get(latency_key, latency)
+        average += self.LATENCY_ALPHA * (latency - average)
+        self._latency[latency_key] = average
+        baseline: float = self._latency_baseline.get(latency_key, average)
+        if average < baseline:
+            baseline = average
+        else:
+            baseline += self.LATENCY_BASELINE_ALPHA * (average - baseline)
+        self._latency_baseline[latency_key] = baseline
+        return average > baseline * self.LATENCY_THRESHOLD
+
+    def next_interval(
+        self, current_secs: float, churn: int, latency: float, latency_key: str
+    ) -> float:
+        """Calculate the interval to use for the next refresh."""
+        ret: float = current_secs
+        if self._is_loaded(latency, latency_key):
+            self._quiet_refreshes = 0
+            ret = current_secs * self.BACKOFF_FACTOR
+        elif churn > 0:
+            self._quiet_refreshes = 0
+            ret = current_secs / 2
+        else:
+            self._quiet_refreshes += 1
+            if self._quiet_refreshes >= self.QUIET_REFRESHES:
+                self._quiet_refreshes = 0
+                ret = current_secs * self.BACKOFF_FACTOR
+
+        return min(max(ret, self.min_secs), self.max_secs)
+
+
 class LinksysVelopUpdateCoordinator(DataUpdateCoordinator):
-    """Retrieve the data from the Velop mesh."""
+    """Retrieve the data from the Velop mesh.
+
+    Refreshes are tiered.  The fast tier gathers the devices, nodes and
+    backhaul on every poll.  The slow tier gathers everything, including the
+    settings that rarely change, and runs when slow_tier_interval has passed
+    or when requested.  A scoped refresh gathers only the details changed by
+    an action, e.g. after changing a setting.
+    """
 
     def __init__(
         self,
         hass: HomeAssistant,
         logger: logging.Logger,
-        mesh: Mesh,
+        mesh: LinksysVelopMesh,
         name: str,
         *,
         update_interval_secs: float,
+        slow_tier_interval_secs: float,
+        adaptive_interval: AdaptiveInterval | None = None,
     ) -> None:
-        """Initialise."""
+        """Initialise.
+
+        If adaptive_interval is given it adjusts the interval between refreshes,
+        starting from update_interval_secs.
+        """
 
         self.config_entry: LinksysVelopConfigEntry
+        self.normal_update_interval: timedelta = timedelta(seconds=update_interval_secs)
         super().__init__(
             hass,
             logger,
             name=name,
-            update_interval=timedelta(seconds=update_interval_secs),
+            update_interval=self.normal_update_interval,
         )
 
         self.log_formatter = Logger(self.config_entry.unique_id)
-        self._mesh: Mesh = mesh
+        self._mesh: LinksysVelopMesh = mesh
+
+        self.adaptive_interval: AdaptiveInterval | None = adaptive_interval
+        self.changed_ids: set[str] = set()
+        self.changes: list[MeshChange] = []
+        self.devices_by_id: dict[str, Device] = {}
+        self.last_gathered: float | None = None
+        self.last_tier: PollTier | None = None
+        self.nodes_by_id: dict[str, Node] = {}
+        self.nodes_by_serial: dict[str, Node] = {}
+        self.slow_tier_interval: timedelta = timedelta(seconds=slow_tier_interval_secs)
+        self._differ: MeshDiffer = MeshDiffer()
+        self._fingerprints: dict[str, int] = {}
+        self._scoped_lock: asyncio.Lock = asyncio.Lock()
+        self._scoped_props: JNAPActionMappings | None = None
+        self._slow_tier_last_refreshed: float | None = None
+        self._slow_tier_requested: bool = False
+        self._update_interval_before_stale: timedelta | None = None
+        self._write_locks: dict[JNAPActionMappings, asyncio.Lock] = {}
+
+    def _build_indexes(self) -> None:
+        """Index the devices and nodes from the last refresh.
+
+        Built once per refresh so that lookups from entities, services and
+        device trackers don't need to scan the full lists.  The details
+        derived from the devices are built at the same time.
+        """
+        derived: DerivedMeshData = DerivedMeshData()
+        self.devices_by_id = {}
+        device: Device
+        for device in self._mesh.devices:
+            self.devices_by_id[device.unique_id] = device
+            details: dict[str, Any] = {"name": device.name, "id": device.unique_id}
+            adapter: dict[str, Any]
+            for adapter in device.network:
+                if adapter.get("ip"):
+                    details.update(
+                        ip=adapter.get("ip"),
+                        connection=adapter.get("type"),
+                        guest_network=adapter.get("guest_network"),
+                    )
+            if device.status is True:
+                derived.online_devices.append(details)
+                if details.get("guest_network"):
+                    derived.guest_devices.append(details)
+            elif device.status is False:
+                derived.offline_devices.append(details)
+        self._mesh.derived = derived
+
+        self.nodes_by_id = {node.unique_id: node for node in self._mesh.nodes}
+        self.nodes_by_serial = {node.serial: node for node in self.nodes_by_id.values()}
+
+    def _build_change_set(self) -> None:
+        """Establish the devices and nodes that have changed since the last refresh.
+
+        The Mesh is keyed on the config entry ID, matching the context used by
+        the Mesh entities, and is considered changed if anything else has.
+        Everything is considered changed if the last refresh failed.
+        """
+        fingerprints: dict[str, int] = {
+            unique_id: _fingerprint(obj)
+            for unique_id, obj in chain(
+                self.devices_by_id.items(), self.nodes_by_id.items()
+            )
+        }
+        fingerprints[self.config_entry.entry_id] = _fingerprint(self._mesh)
+
+        if not self.last_update_success:
+            self.changed_ids = set(fingerprints)
+        else:
+            self.changed_ids = {
+                unique_id
+                for unique_id, fingerprint in fingerprints.items()
+                if self._fingerprints.get(unique_id) != fingerprint
+            }
+            if self.changed_ids:
+                self.changed_ids.add(self.config_entry.entry_id)
+
+        self._fingerprints = fingerprints
+        self.log_formatter.debug(
+            _LOGGER,
+            "%i of %i objects changed",
+            len(self.changed_ids),
+            len(fingerprints),
+        )
+
+    def _build_mesh_changes(self) -> None:
+        """Establish the changes to the devices and nodes since the last refresh."""
+        self.changes = self._differ.diff(self.devices_by_id | self.nodes_by_id)
+        self.log_formatter.debug(_LOGGER, "%i changes found", len(self.changes))
+
+    def _count_churn(self) -> int:
+        """Count the devices that joined, left or changed status."""
+        return len(
+            {
+                change.unique_id
+                for change in self.changes
+                if not change.is_node
+                and change.change_type
+                in (MeshChangeType.ADDED, MeshChangeType.REMOVED, MeshChangeType.STATUS)
+            }
+        )
+
+    def _adapt_update_interval(
+        self, compared: bool, latency: float, tier: PollTier
+    ) -> None:
+        """Set the interval for the next refresh if it's adaptive.
+
+        :param compared: True if the refresh was compared with a previous one
+        """
+        if self.adaptive_interval is not None and compared:
+            churn: int = self._count_churn()
+            next_interval: float = self.adaptive_interval.next_interval(
+                self.update_interval.total_seconds(), churn, latency, tier
+            )
+            self.log_formatter.debug(
+                _LOGGER,
+                "%i devices changed, took %.3fs, next refresh in %.1fs",
+                churn,
+                latency,
+                next_interval,
+            )
+            self.update_interval = timedelta(seconds=next_interval)
+
+        self._mesh.scan_interval = self.update_interval.total_seconds()
+
+    def _continue_with_stale_data(self) -> bool:
+        """Establish if the last good details can be used after a failed refresh.
+
+        They can be used for the configured number of failed refreshes, as long
+        as they are not older than the configured age.  Whilst they are used,
+        refreshes are retried with an exponential backoff, up to the normal
+        interval.
+        """
+        max_failures: int = self.config_entry.options.get(
+            CONF_STALE_MAX_FAILURES, DEF_STALE_MAX_FAILURES
+        )
+        max_age: float = self.config_entry.options.get(
+            CONF_STALE_MAX_AGE, DEF_STALE_MAX_AGE
+        )
+        if (
+            not self.last_update_success
+            or self.last_gathered is None
+            or self._mesh.failed_refreshes >= max_failures
+            or time.monotonic() - self.last_gathered > max_age
+        ):
+            return False
+
+        if self._update_interval_before_stale is None:
+            self._update_interval_before_stale = self.update_interval
+        self.update_interval = min(
+            timedelta(
+                seconds=DEF_STALE_RETRY_INTERVAL_SECS * 2**self._mesh.failed_refreshes
+            ),
+            self._update_interval_before_stale,
+        )
+        self._mesh.failed_refreshes += 1
+        self._mesh.is_stale = True
+
+        # only the Mesh has changed, so that the stale state is shown
+        self._fingerprints[self.config_entry.entry_id] = _fingerprint(self._mesh)
+        self.changed_ids = {self.config_entry.entry_id}
+
+        self.log_formatter.debug(
+            _LOGGER,
+            "using stale details after %i failed refreshes, retrying in %s",
+            self._mesh.failed_refreshes,
+            self.update_interval,
+        )
+        return True
+
+    def has_changed(self, unique_id: str) -> bool:
+        """Establish if the given device, node or Mesh changed in the last refresh."""
+        return unique_id in self.changed_ids
+
+    def set_normal_update_interval(self, update_interval_secs: float) -> None:
+        """Change the interval between refreshes.
+
+        An adaptive interval starts again from the new interval and the next
+        refresh is rescheduled to use it.  Whilst the stale details are being
+        used the retries carry on and the new interval is used afterwards.
+        """
+        self.normal_update_interval = timedelta(seconds=update_interval_secs)
+        if self._update_interval_before_stale is not None:
+            self._update_interval_before_stale = self.normal_update_interval
+        else:
+            self.update_interval = self.normal_update_interval
+            if self._listeners:
+                self._schedule_refresh()
+
+    def is_fresh(self, max_age: timedelta) -> bool:
+        """Establish if the devices were gathered within max_age."""
+        return (
+            self.last_update_success
+            and self.last_gathered is not None
+            and time.monotonic() - self.last_gathered < max_age.total_seconds()
+        )
+
+    @callback
+    def async_set_restored_data(self) -> None:
+        """Use the details restored into the Mesh until the next refresh.
+
+        The restored details can be hours old so they aren't used as the
+        baseline for the changes, the first live refresh is.
+        """
+        self._build_indexes()
+        self.changes = []
+        self._build_change_set()
+        self.async_set_updated_data(self._mesh)
+
+    def _needs_slow_tier(self) -> bool:
+        """Establish if the next refresh should gather everything."""
+        return (
+            self._slow_tier_requested
+            or self._slow_tier_last_refreshed is None
+            or not self.last_update_success
+            or time.monotonic() - self._slow_tier_last_refreshed
+            >= self.slow_tier_interval.total_seconds()
+        )
+
+    def request_slow_tier(self) -> None:
+        """Ensure that the next refresh gathers everything."""
+        self._slow_tier_requested = True
+
+    def get_write_lock(self, resource: JNAPActionMappings) -> asyncio.Lock:
+        """Get the lock that serialises the writes to the given resource."""
+        if (lock := self._write_locks.get(resource)) is None:
+            lock = self._write_locks[resource] = asyncio.Lock()
+        return lock
+
+    async def async_refresh_scoped(self, props: JNAPActionMappings) -> None:
+        """Refresh only the given details and merge them into the Mesh.
+
+        The devices are rebuilt only if props includes DEVICES_REFRESH_PROPS.
+        The props of calls made whilst a scoped refresh is in progress are
+        merged and gathered together by the next one.  The refresh doesn't go
+        through async_refresh, so a scheduled refresh can't gather the props
+        in its place.
+        """
+        self._scoped_props = (
+            props if self._scoped_props is None else self._scoped_props | props
+        )
+        async with self._scoped_lock:
+            scoped_props: JNAPActionMappings | None = self._scoped_props
+            self._scoped_props = None
+            # gathered with the props of an earlier call
+            if scoped_props is None:
+                return
+
+            try:
+                data: LinksysVelopMesh = await self._async_refresh_tier(scoped_props)
+            except UpdateFailed as err:
+                self.last_exception = err
+                self.last_update_success = False
+                self.async_update_listeners()
+            else:
+                self.async_set_updated_data(data)
 
     async def _async_update_data(self):
         """Refresh the mesh data."""
+        return await self._async_refresh_tier()
 
-        current_devices: list[str] = []
-        previous_devices: list[str] = []
-        previous_nodes: list[str] = []
-        previous_nodes_details: list[Node] = []
+    async def _async_refresh_tier(
+        self, scoped_props: JNAPActionMappings | None = None
+    ) -> LinksysVelopMesh:
+        """Refresh the tier that is due, or only the given props."""
 
         configured_events: list[str] = self.config_entry.options.get(
             CONF_EVENTS_OPTIONS, DEF_EVENTS_OPTIONS
         )
 
+        tier: PollTier
+        if scoped_props is not None:
+            tier = PollTier.SCOPED
+        elif self._needs_slow_tier():
+            tier = PollTier.SLOW
+        else:
+            tier = PollTier.FAST
+        self.log_formatter.debug(_LOGGER, "refreshing the %s tier", tier)
+        gather_start: float = time.perf_counter()
         try:
-            previous_nodes_details = list(self._mesh.nodes)
-            if EventSubTypes.NEW_NODE_FOUND.value in configured_events:
-                previous_nodes = [node.unique_id for node in self._mesh.nodes]
-            if EventSubTypes.NEW_DEVICE_FOUND.value in configured_events:
-                previous_devices = [device.unique_id for device in self._mesh.devices]
-        except MeshNeedsGatherDetails:
-            pass
-
-        try:
-            await self._mesh.async_gather_details()
+            if tier == PollTier.SLOW:
+                await self._mesh.async_gather_details()
+            elif tier == PollTier.SCOPED:
+                await self._mesh.async_gather_partial_details(scoped_props)
+            else:
+                await self._mesh.async_gather_partial_details(_FAST_TIER_PROPS)
         except MeshTimeoutError as err:
             exc_mesh_timeout: CoordinatorMeshTimeout = CoordinatorMeshTimeout(
                 translation_domain=DOMAIN,
@@ -144,6 +587,8 @@ class LinksysVelopUpdateCoordinator(DataUpdateCoordinator):
                 },
             )
             _LOGGER.warning(exc_mesh_timeout)
+            if self._continue_with_stale_data():
+                return self._mesh
             raise UpdateFailed(err) from err
         except Exception as err:
             exc_general: GeneralException = GeneralException(
@@ -155,15 +600,44 @@ class LinksysVelopUpdateCoordinator(DataUpdateCoordinator):
                 },
             )
             _LOGGER.warning(exc_general)
+            if self._continue_with_stale_data():
+                return self._mesh
             raise UpdateFailed(err) from err
         else:
+            if self._update_interval_before_stale is not None:
+                self.update_interval = self._update_interval_before_stale
+                self._update_interval_before_stale = None
+            self._mesh.failed_refreshes = 0
+
+            if tier == PollTier.SLOW:
+                self._slow_tier_last_refreshed = time.monotonic()
+                self._slow_tier_requested = False
+                if (
+                    snapshot_store := self.config_entry.runtime_data.snapshot_store
+                ) is not None:
+                    snapshot_store.async_schedule_save(self._mesh)
+            if tier != PollTier.SCOPED or scoped_props & JNAPActionMappings.GET_DEVICES:
+                self.last_gathered = time.monotonic()
+            self.last_tier = tier
+            self._mesh.is_stale = False
+
+            compared: bool = self._differ.has_baseline
+            self._build_indexes()
+            self._build_mesh_changes()
+            # scoped refreshes follow actions so don't reflect the mesh load
+            if tier != PollTier.SCOPED:
+                self._adapt_update_interval(
+                    compared, time.perf_counter() - gather_start, tier
+                )
+            self._build_change_set()
+            change: MeshChange
+
             # region #-- issue management --#
             # region #-- missing ui devices --#
             if len(self.config_entry.options.get(CONF_UI_DEVICES, [])) > 0:
-                current_devices = [device.unique_id for device in self._mesh.devices]
                 missing_ui_devices: set[str] = set(
                     self.config_entry.options.get(CONF_UI_DEVICES, [])
-                ).difference(current_devices)
+                ).difference(self.devices_by_id)
                 missing_ui_devices.discard(DEF_UI_PLACEHOLDER_DEVICE_ID)
                 device_registry: DeviceRegistry = dr.async_get(self.hass)
                 for ui_device in missing_ui_devices:
@@ -199,25 +673,21 @@ class LinksysVelopUpdateCoordinator(DataUpdateCoordinator):
                             )
             # endregion
             # region #-- missing nodes --#
-            current_nodes: list[str] = [node.unique_id for node in self._mesh.nodes]
-            removed_nodes: set[str] = set(previous_nodes).difference(set(current_nodes))
             device_registry: DeviceRegistry = dr.async_get(self.hass)
-            for node in removed_nodes:
-                node_info: list[Node]
-                if node_info := [
-                    n for n in previous_nodes_details if n.unique_id == node
-                ]:
+            for change in self.changes:
+                if change.change_type == MeshChangeType.REMOVED and change.is_node:
+                    node_info: Node = change.previous
                     found_device: DeviceEntry | None = device_registry.async_get_device(
-                        {(DOMAIN, node_info[0].serial)}
+                        {(DOMAIN, node_info.serial)}
                     )
                     if found_device is not None:
                         ir.async_create_issue(
                             self.hass,
                             DOMAIN,
-                            f"{ISSUE_MISSING_NODE}::{node_info[0].serial}",
+                            f"{ISSUE_MISSING_NODE}::{node_info.serial}",
                             data={
                                 "config_entry": self.config_entry,
-                                "device_id": node_info[0].serial,
+                                "device_id": node_info.serial,
                                 "device_name": found_device.name_by_user
                                 or found_device.name,
                             },
@@ -234,53 +704,95 @@ class LinksysVelopUpdateCoordinator(DataUpdateCoordinator):
             # endregion
 
             # region #-- event management --#
-            # region #-- check for new devices --#
-            if EventSubTypes.NEW_DEVICE_FOUND.value in configured_events:
-                if len(current_devices) == 0:
-                    current_devices = [
-                        device.unique_id for device in self._mesh.devices
-                    ]
-                new_devices: set[str] = set(current_devices).difference(
-                    set(previous_devices)
+            new_ids: set[str] = {
+                change.unique_id
+                for change in self.changes
+                if change.change_type == MeshChangeType.ADDED
+            }
+            if (
+                known_devices := self.config_entry.runtime_data.known_devices
+            ) is not None:
+                new_ids = known_devices.async_update(
+                    self.devices_by_id.keys() | self.nodes_by_id.keys()
                 )
-                device_info: list[Device] | Device
-                for device in new_devices:
-                    if (
-                        device_info := [
-                            d for d in self._mesh.devices if d.unique_id == device
-                        ]
-                    ) != []:
-                        device_info = device_info[0]
-                        async_dispatcher_send(
-                            self.hass,
-                            f"{DOMAIN}_{EventSubTypes.NEW_DEVICE_FOUND.value}",
-                            device_info,
-                        )
-            # endregion
-            # region #-- check for new nodes --#
-            if EventSubTypes.NEW_NODE_FOUND.value in configured_events:
-                if len(previous_nodes) > 0:
-                    current_nodes: list[str] = [
-                        node.unique_id for node in self._mesh.nodes
-                    ]
-                    new_nodes: set[str] = set(current_nodes).difference(
-                        set(previous_nodes)
+            events: list[tuple[EventSubTypes, tuple]] = [
+                (
+                    (EventSubTypes.NEW_NODE_FOUND, (self.nodes_by_id[unique_id],))
+                    if unique_id in self.nodes_by_id
+                    else (
+                        EventSubTypes.NEW_DEVICE_FOUND,
+                        (self.devices_by_id[unique_id],),
                     )
-                    if len(new_nodes) > 0:
-                        node_info: list[Node]
-                        for node in new_nodes:
-                            if node_info := [
-                                n for n in self._mesh.nodes if n.unique_id == node
-                            ]:
-                                async_dispatcher_send(
-                                    self.hass,
-                                    f"{DOMAIN}_{EventSubTypes.NEW_NODE_FOUND.value}",
-                                    node_info[0],
-                                )
-                        self.hass.config_entries.async_schedule_reload(
-                            self.config_entry.entry_id
-                        )
+                )
+                for unique_id in new_ids
+            ]
+            # the changes are only trusted against a live baseline, so none are
+            # sent for the first live refresh after the snapshot is restored
+            if compared:
+                events.extend(filter(None, map(_event_for_change, self.changes)))
+
+            # events of a type past the threshold are sent as a single bulk
+            # event so a mesh restart doesn't flood them
+            events_by_type: dict[EventSubTypes, list[tuple]] = {}
+            for event_type, event_args in events:
+                if event_type.value in configured_events:
+                    events_by_type.setdefault(event_type, []).append(event_args)
+            bulk_threshold: int = self.config_entry.options.get(
+                CONF_EVENTS_BULK_THRESHOLD, DEF_EVENTS_BULK_THRESHOLD
+            )
+            events_args: list[tuple]
+            for event_type, events_args in events_by_type.items():
+                if len(events_args) > bulk_threshold:
+                    async_dispatcher_send(
+                        self.hass,
+                        f"{DOMAIN}_{EventSubTypes.BULK_EVENTS.value}",
+                        event_type,
+                        [event_args[0] for event_args in events_args],
+                    )
+                    continue
+                for event_args in events_args:
+                    async_dispatcher_send(
+                        self.hass, f"{DOMAIN}_{event_type.value}", *event_args
+                    )
+            # region #-- new nodes --#
+            # without a baseline, e.g. after restoring the snapshot, any node
+            # could be new so the platforms are given them all to check
+            new_nodes: set[str] = (
+                {
+                    change.unique_id
+                    for change in self.changes
+                    if change.change_type == MeshChangeType.ADDED and change.is_node
+                }
+                if compared
+                else set(self.nodes_by_id)
+            )
+            if new_nodes:
+                # the platforms add the entities for the new nodes
+                async_dispatcher_send(
+                    self.hass,
+                    f"{SIGNAL_NEW_NODES}_{self.config_entry.entry_id}",
+                    new_nodes,
+                )
+            # endregion
             # endregion
+
+            # region #-- device trackers --#
+            if (
+                presence_engine := self.config_entry.runtime_data.presence_engine
+            ) is not None:
+                # the engine compares the devices itself so they are all given
+                # to it when there is no baseline
+                presence_engine.async_process(
+                    [
+                        change.current
+                        for change in self.changes
+                        if not change.is_node
+                        and change.change_type
+                        in (MeshChangeType.IP, MeshChangeType.STATUS)
+                    ]
+                    if compared
+                    else list(self.devices_by_id.values())
+                )
             # endregion
 
         return self._mesh
@@ -313,6 +825,18 @@ class UpdateCoordinatorChangeableInterval(DataUpdateCoordinator):
             update_interval=self.normal_update_interval,
         )
 
+    def set_normal_update_interval(self, update_interval_secs: float) -> None:
+        """Change the interval used when no task is in progress.
+
+        The next refresh is rescheduled to use the new interval.
+        """
+        in_progress: bool = self.update_interval == self.progress_update_interval
+        self.normal_update_interval = timedelta(seconds=update_interval_secs)
+        if not in_progress:
+            self.update_interval = self.normal_update_interval
+            if self._listeners:
+                self._schedule_refresh()
+
 
 class LinksysVelopUpdateCoordinatorSpeedtest(UpdateCoordinatorChangeableInterval):
     """Retrieve the Speedtest data from the Velop mesh."""
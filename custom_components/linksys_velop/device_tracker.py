@@ -10,24 +10,19 @@ from homeassistant.components.device_tracker.config_entry import (
     ScannerEntity,
     SourceType,
 )
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceEntry, DeviceRegistry
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.util import dt as dt_util
 from pyvelop.device import Device
 from pyvelop.mesh import Mesh
 
-from .const import (
-    CONF_DEVICE_TRACKERS,
-    DEF_CONSIDER_HOME,
-    DOMAIN,
-    SIGNAL_DEVICE_TRACKER_UPDATE,
-)
+from .const import CONF_DEVICE_TRACKERS, DEF_CONSIDER_HOME
+from .coordinator import LinksysVelopUpdateCoordinator
 from .helpers import get_mesh_device_for_config_entry
 from .logger import Logger
+from .presence import PresenceState
 from .types import CoordinatorTypes, LinksysVelopConfigEntry
 
 # endregion
@@ -42,21 +37,24 @@ async def async_setup_entry(
 ) -> None:
 
     adapter: list[dict]
-    device: list[Device]
+    device: Device | None
     device_trackers: list[LinksysVelopMeshDeviceTracker] = []
     connections: set[tuple[str, str]] = set()
-    mesh: Mesh = config_entry.runtime_data.coordinators[CoordinatorTypes.MESH]._mesh
+    coordinator: LinksysVelopUpdateCoordinator = config_entry.runtime_data.coordinators[
+        CoordinatorTypes.MESH
+    ]
+    mesh: Mesh = coordinator._mesh
     for tracked_device in config_entry.options.get(CONF_DEVICE_TRACKERS, []):
-        if device := [d for d in mesh.devices if d.unique_id == tracked_device]:
+        if (device := coordinator.devices_by_id.get(tracked_device)) is not None:
             device_trackers.append(
                 LinksysVelopMeshDeviceTracker(
                     config_entry=config_entry,
-                    device=device[0],
+                    device=device,
                     mesh=mesh,
                 )
             )
 
-            if adapter := [a for a in device[0].network]:
+            if adapter := [a for a in device.network]:
                 connections.add(
                     (
                         dr.CONNECTION_NETWORK_MAC,
@@ -88,86 +86,75 @@ class LinksysVelopMeshDeviceTracker(ScannerEntity):
             f"{self._config_entry.entry_id}::{ENTITY_DOMAIN.lower()}::{self._device_id}"
         )
         self._consider_home_cancel: CALLBACK_TYPE | None = None
-        self._ip_address: str = self._get_ip_address(device)
-        self._is_connected: bool = device.status
         self._log_formatter: Logger = Logger(self._config_entry.unique_id)
-        self._mac_address: str = self._get_mac_address(device)
         self._mesh: Mesh = mesh
+        self._state: PresenceState = PresenceState.from_device(device)
+        self._ip_address: str | None = self._state.ip_address
+        self._is_connected: bool = self._state.is_connected
+        self._mac_address: str | None = self._state.mac_address
 
-    def _get_ip_address(self, device: Device) -> str:
-        """Retrieve the IP address from the device object."""
-        adapter: list[dict]
-        if adapter := [a for a in device.network]:
-            return adapter[0].get("ip", "")
-
-    def _get_mac_address(self, device: Device) -> str:
-        """Retrieve the MAC address from the device object."""
-        adapter: list[dict]
-        if adapter := [a for a in device.network]:
-            return dr.format_mac(adapter[0].get("mac", ""))
-
-    async def _async_mark_offline(self, _: dt_util.dt.datetime) -> None:
+    @callback
+    def _async_mark_offline(self) -> None:
         """Mark the device tracker as offline."""
-        _LOGGER.debug(
-            self._log_formatter.format("%s is now being marked offline"),
-            self.name,
-        )
+        self._log_formatter.debug(_LOGGER, "%s is now being marked offline", self.name)
         self._is_connected = False
         self._consider_home_cancel = None
         self.async_schedule_update_ha_state()
 
-    async def _async_process_device_update(self, device: Device) -> None:
+    @callback
+    def _async_process_device_update(self, state: PresenceState) -> None:
         """Establish device state or attribute changes."""
-        self._ip_address = self._get_ip_address(device)
-        self._mac_address = self._get_mac_address(device)
-        if device.status != self.is_connected:
-            if device.status:
-                _LOGGER.debug(self._log_formatter.format("%s: back online"), self.name)
+        # the addresses are state attributes so need writing when they change
+        write_state: bool = (state.ip_address, state.mac_address) != (
+            self._ip_address,
+            self._mac_address,
+        )
+        self._state = state
+        self._ip_address = state.ip_address
+        self._mac_address = state.mac_address
+        if state.is_connected != self.is_connected:
+            if state.is_connected:
+                self._log_formatter.debug(_LOGGER, "%s: back online", self.name)
                 self._is_connected = True
-                self.async_schedule_update_ha_state()
+                write_state = True
             else:
                 if self._consider_home_cancel is None:
-                    fire_at: dt_util.dt.datetime = dt_util.dt.datetime.fromtimestamp(
-                        int(device.results_time)
-                        + self._config_entry.options.get(
-                            CONF_CONSIDER_HOME, DEF_CONSIDER_HOME
-                        )
+                    fire_at: int = int(
+                        state.results_time
+                    ) + self._config_entry.options.get(
+                        CONF_CONSIDER_HOME, DEF_CONSIDER_HOME
                     )
-                    _LOGGER.debug(
-                        self._log_formatter.format(
-                            "%s: setting consider home listener for %s"
-                        ),
+                    self._log_formatter.debug(
+                        _LOGGER,
+                        "%s: setting consider home listener for %s",
                         self.name,
-                        fire_at,
+                        dt_util.utc_from_timestamp(fire_at),
                     )
-                    self._consider_home_cancel = async_track_point_in_time(
-                        hass=self.hass,
-                        action=self._async_mark_offline,
-                        point_in_time=fire_at,
+                    self._consider_home_cancel = (
+                        self._config_entry.runtime_data.presence_engine.async_expire_at(
+                            self._device_id, fire_at, self._async_mark_offline
+                        )
                     )
         else:
             if self._consider_home_cancel is not None:
-                _LOGGER.debug(
-                    self._log_formatter.format(
-                        "%s: back online in consider_home period"
-                    ),
-                    self.name,
+                self._log_formatter.debug(
+                    _LOGGER, "%s: back online in consider_home period", self.name
                 )
-                _LOGGER.debug(
-                    self._log_formatter.format("%s: cancelling consider home"),
-                    self.name,
+                self._log_formatter.debug(
+                    _LOGGER, "%s: cancelling consider home", self.name
                 )
                 self._consider_home_cancel()
                 self._consider_home_cancel = None
 
+        if write_state:
+            self.async_schedule_update_ha_state()
+
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
         self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                f"{SIGNAL_DEVICE_TRACKER_UPDATE}_{self._device_id}",
-                self._async_process_device_update,
+            self._config_entry.runtime_data.presence_engine.async_subscribe(
+                self._device_id, self._state, self._async_process_device_update
             )
         )
 
@@ -0,0 +1,130 @@
+"""Changes to the devices and nodes between refreshes."""
+
+# region #-- imports --#
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from pyvelop.device import Device
+from pyvelop.node import Node
+
+from .types import MeshChangeType
+
+# endregion
+
+
+@dataclass(frozen=True)
+class _ObjectState:
+    """The details of a device or node that are compared between refreshes."""
+
+    ip: str | None
+    name: str | None
+    parent: str | None
+    status: bool
+
+    @classmethod
+    def from_object(cls, obj: Device | Node) -> _ObjectState:
+        """Build the state from the given device or node."""
+        connection: dict[str, Any] = next(
+            iter(getattr(obj, "_attribs", {}).get("connections", [])), {}
+        )
+        return cls(
+            ip=connection.get("ipAddress"),
+            name=obj.name,
+            parent=obj.parent_name,
+            status=obj.status,
+        )
+
+
+# the details compared and the type of change when they differ
+_COMPARISONS: tuple[tuple[str, MeshChangeType], ...] = (
+    ("status", MeshChangeType.STATUS),
+    ("parent", MeshChangeType.PARENT),
+    ("ip", MeshChangeType.IP),
+    ("name", MeshChangeType.NAME),
+)
+
+
+@dataclass(frozen=True)
+class MeshChange:
+    """A change to a device or node between refreshes."""
+
+    change_type: MeshChangeType
+    unique_id: str
+    current: Device | Node | None = None
+    previous: Device | Node | None = None
+    new_value: Any = None
+    old_value: Any = None
+
+    @property
+    def is_node(self) -> bool:
+        """Establish if the change is for a node."""
+        return isinstance(self.current or self.previous, Node)
+
+
+class MeshDiffer:
+    """Establish the changes to the devices and nodes between refreshes.
+
+    The objects from each refresh are held, keyed on their unique ID, so the
+    next refresh can be compared with them in a single pass.
+    """
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self._objects: dict[str, Device | Node] | None = None
+        self._states: dict[str, _ObjectState] = {}
+
+    @property
+    def has_baseline(self) -> bool:
+        """Establish if there is a previous refresh to compare with."""
+        return self._objects is not None
+
+    def diff(self, objects: dict[str, Device | Node]) -> list[MeshChange]:
+        """Compare the given objects with those from the previous call.
+
+        Nothing is reported the first time as there is nothing to compare with.
+
+        :param objects: the devices and nodes keyed on their unique ID
+        :return: the changes since the previous call
+        """
+        states: dict[str, _ObjectState] = {
+            unique_id: _ObjectState.from_object(obj)
+            for unique_id, obj in objects.items()
+        }
+        ret: list[MeshChange] = []
+        if self._objects is not None:
+            unique_id: str
+            for unique_id, obj in objects.items():
+                if (previous_state := self._states.get(unique_id)) is None:
+                    ret.append(MeshChange(MeshChangeType.ADDED, unique_id, current=obj))
+                    continue
+
+                attribute: str
+                change_type: MeshChangeType
+                for attribute, change_type in _COMPARISONS:
+                    old_value: Any = getattr(previous_state, attribute)
+                    new_value: Any = getattr(states[unique_id], attribute)
+                    if old_value != new_value:
+                        ret.append(
+                            MeshChange(
+                                change_type,
+                                unique_id,
+                                current=obj,
+                                previous=self._objects.get(unique_id),
+                                new_value=new_value,
+                                old_value=old_value,
+                            )
+                        )
+            for unique_id in self._objects.keys() - objects.keys():
+                ret.append(
+                    MeshChange(
+                        MeshChangeType.REMOVED,
+                        unique_id,
+                        previous=self._objects[unique_id],
+                    )
+                )
+
+        self._objects = dict(objects)
+        self._states = states
+        return ret
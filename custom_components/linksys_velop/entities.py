@@ -1,6 +1,7 @@
 """"""
 
 # region #-- imports --#
+import dataclasses
 import logging
 from dataclasses import dataclass
 from datetime import date, datetime
@@ -8,9 +9,12 @@ from decimal import Decimal
 from enum import IntFlag, auto
 from typing import Any, Callable
 
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import slugify
@@ -20,16 +24,24 @@ from pyvelop.mesh import Mesh
 from pyvelop.node import Node, NodeType
 
 from .const import (
+    CONF_ATTRIBUTES_MAX_ITEMS,
+    CONF_ATTRIBUTES_UNRECORDED,
     CONF_UI_DEVICES,
+    CONF_UI_DEVICES_LEAN,
+    CONF_UI_DEVICES_LEAN_CHANGED,
+    DEF_ATTRIBUTES_MAX_ITEMS,
+    DEF_ATTRIBUTES_UNRECORDED,
+    DEF_UI_DEVICES_LEAN,
     DEF_UI_PLACEHOLDER_DEVICE_ID,
     DOMAIN,
     PYVELOP_AUTHOR,
     PYVELOP_NAME,
     PYVELOP_VERSION,
+    SIGNAL_NEW_NODES,
     SIGNAL_UI_PLACEHOLDER_DEVICE_UPDATE,
 )
 from .logger import Logger
-from .types import CoordinatorTypes, LinksysVelopConfigEntry
+from .types import CoordinatorTypes, LinksysVelopConfigEntry, PollTier
 
 # endregion
 
@@ -71,34 +83,127 @@ class EntityDetails:
     description: Any
     entity_type: EntityType
     coordinator_type: CoordinatorTypes = CoordinatorTypes.MESH
+    esa_list_key: str = ""
     esa_value_func: EsaValueType = None
+    lean_core: bool = False
     pic_value_func: PicValueType = None
+    poll_tier: PollTier = PollTier.FAST
     state_value_func: StateValueType = None
 
 
+def _is_lean_optional(entity: EntityDetails) -> bool:
+    """Establish if the device entity is left disabled in lean mode.
+
+    Diagnostic entities that aren't part of the core set are optional.
+    """
+    return (
+        entity.entity_type == EntityType.DEVICE
+        and not entity.lean_core
+        and entity.description.entity_category == EntityCategory.DIAGNOSTIC
+    )
+
+
+def _is_disabled_in_registry(
+    entity_registry: er.EntityRegistry, entity_domain: str, unique_id: str
+) -> bool:
+    """Establish if the entity is registered and disabled."""
+    entity_id: str | None = entity_registry.async_get_entity_id(
+        entity_domain, DOMAIN, unique_id
+    )
+    return entity_id is not None and entity_registry.async_get(entity_id).disabled
+
+
+def _apply_lean_to_registry(
+    entity_registry: er.EntityRegistry, entity_domain: str, unique_id: str, lean: bool
+) -> None:
+    """Disable or enable a registered optional entity when lean mode changes.
+
+    Only entities that the integration disabled are enabled again, so those
+    disabled by the user stay disabled.
+    """
+    entity_id: str | None = entity_registry.async_get_entity_id(
+        entity_domain, DOMAIN, unique_id
+    )
+    if entity_id is None:
+        return
+
+    disabled_by: er.RegistryEntryDisabler | None = entity_registry.async_get(
+        entity_id
+    ).disabled_by
+    if lean and disabled_by is None:
+        entity_registry.async_update_entity(
+            entity_id, disabled_by=er.RegistryEntryDisabler.INTEGRATION
+        )
+    elif not lean and disabled_by == er.RegistryEntryDisabler.INTEGRATION:
+        entity_registry.async_update_entity(entity_id, disabled_by=None)
+
+
 def build_entities(
     entity_details: list[EntityDetails],
     config_entry: LinksysVelopConfigEntry,
     entity_domain: str,
+    node_ids: set[str] | None = None,
 ) -> list[dict[str, EntityContext | LinksysVelopConfigEntry | str | EntityDetails]]:
-    """"""
+    """Build the arguments for the entities.
+
+    If node_ids is given only the entities for those nodes are built.
+
+    In lean mode the optional device entities are registered disabled and
+    aren't built at all once they are disabled in the registry.  Enabling one
+    reloads the config entry, which builds it.  When lean mode is changed the
+    optional entities that are already registered are disabled, or enabled,
+    to match.
+    """
 
     ret: list[
         dict[str, EntityContext | LinksysVelopConfigEntry | str | EntityDetails]
     ] = []
 
+    lean: bool = config_entry.options.get(CONF_UI_DEVICES_LEAN, DEF_UI_DEVICES_LEAN)
+    lean_changed: bool = config_entry.options.get(CONF_UI_DEVICES_LEAN_CHANGED, False)
+    entity_registry: er.EntityRegistry | None = None
+    if lean or lean_changed:
+        entity_registry = er.async_get(
+            config_entry.runtime_data.coordinators.get(CoordinatorTypes.MESH).hass
+        )
+
     for entity in entity_details:
+        if node_ids is not None and entity.entity_type not in EntityType.NODE:
+            continue
+
         if entity.entity_type in (EntityType.DEVICE, EntityType.PLACEHOLDER_DEVICE):
+            optional: bool = _is_lean_optional(entity)
+            lean_optional: bool = lean and optional
+            details: EntityDetails = entity
+            if lean_optional:
+                details = dataclasses.replace(
+                    entity,
+                    description=dataclasses.replace(
+                        entity.description, entity_registry_enabled_default=False
+                    ),
+                )
             for ui_device in config_entry.options.get(CONF_UI_DEVICES, []):
                 if entity.entity_type == EntityType.DEVICE or (
                     entity.entity_type == EntityType.PLACEHOLDER_DEVICE
                     and ui_device == DEF_UI_PLACEHOLDER_DEVICE_ID
                 ):
+                    unique_id: str = (
+                        f"{ui_device}::{entity_domain.lower()}::"
+                        f"{slugify(entity.description.name)}"
+                    )
+                    if lean_changed and optional:
+                        _apply_lean_to_registry(
+                            entity_registry, entity_domain, unique_id, lean
+                        )
+                    if lean_optional and _is_disabled_in_registry(
+                        entity_registry, entity_domain, unique_id
+                    ):
+                        continue
                     ret.append(
                         {
                             "config_entry": config_entry,
                             "context": EntityContext(unique_id=ui_device),
-                            "entity_details": entity,
+                            "entity_details": details,
                             "entity_domain": entity_domain,
                         }
                     )
@@ -118,6 +223,9 @@ def build_entities(
             for node in config_entry.runtime_data.coordinators.get(
                 CoordinatorTypes.MESH
             ).data.nodes:
+                if node_ids is not None and node.unique_id not in node_ids:
+                    continue
+
                 wifi_node: bool = (
                     node.backhaul.get("connection", "").lower() == "wireless"
                 )
@@ -146,6 +254,88 @@ def build_entities(
     return ret
 
 
+def get_entity_class(
+    config_entry: LinksysVelopConfigEntry,
+    entity_details: EntityDetails,
+    entity_class: type["LinksysVelopEntity"],
+    unrecorded_list_class: type["LinksysVelopEntity"] | None = None,
+) -> type["LinksysVelopEntity"]:
+    """Get the class for an entity.
+
+    Entities with a list in the attributes use unrecorded_list_class when
+    the lists shouldn't be recorded.  The unrecorded attributes are declared
+    on the class so Home Assistant picks them up when the entity is added.
+    """
+    if (
+        unrecorded_list_class is not None
+        and entity_details.esa_list_key
+        and config_entry.options.get(
+            CONF_ATTRIBUTES_UNRECORDED, DEF_ATTRIBUTES_UNRECORDED
+        )
+    ):
+        return unrecorded_list_class
+
+    return entity_class
+
+
+@callback
+def async_add_entities_for_new_nodes(
+    hass: HomeAssistant,
+    config_entry: LinksysVelopConfigEntry,
+    entity_details: list[EntityDetails],
+    entity_domain: str,
+    entity_class: type["LinksysVelopEntity"],
+    async_add_entities: AddEntitiesCallback,
+    unrecorded_list_class: type["LinksysVelopEntity"] | None = None,
+) -> None:
+    """Add the node entities for the platform when nodes join the mesh.
+
+    A node that was removed keeps its entities so the node IDs that the
+    platform has built entities for are tracked, otherwise a node that
+    comes back would have its entities added again.
+    """
+
+    # the platform has just built the entities for the current nodes
+    added_node_ids: set[str] = {
+        node.unique_id
+        for node in config_entry.runtime_data.coordinators.get(
+            CoordinatorTypes.MESH
+        ).data.nodes
+    }
+
+    @callback
+    def _async_add_entities(node_ids: set[str]) -> None:
+        """Build and add the entities for the new nodes."""
+        node_ids = node_ids - added_node_ids
+        if not node_ids:
+            return
+
+        added_node_ids.update(node_ids)
+        entities = build_entities(
+            entity_details, config_entry, entity_domain, node_ids=node_ids
+        )
+        if len(entities) > 0:
+            async_add_entities(
+                [
+                    get_entity_class(
+                        config_entry,
+                        entity["entity_details"],
+                        entity_class,
+                        unrecorded_list_class,
+                    )(**entity)
+                    for entity in entities
+                ]
+            )
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            f"{SIGNAL_NEW_NODES}_{config_entry.entry_id}",
+            _async_add_entities,
+        )
+    )
+
+
 class LinksysVelopEntity(CoordinatorEntity):
     """Representation of a Linksys Velop entity."""
 
@@ -235,14 +425,56 @@ class LinksysVelopEntity(CoordinatorEntity):
                     f"{'/ca' if self._context_data.type is NodeType.SECONDARY else ''}"
                 )
 
+    def _context_has_changed(self) -> bool:
+        """Establish if the data for this entity changed in the last refresh.
+
+        Only the mesh coordinator tracks changes and the placeholder device can
+        point at a different device at any time, so always assume a change for
+        those.  Entities relying on the slow tier can't have changed if only
+        the fast tier was refreshed.  The entities for the placeholder UI device
+        follow the device that it points at.
+        """
+        if (
+            self._entity_details.coordinator_type != CoordinatorTypes.MESH
+            or self._entity_details.entity_type == EntityType.PLACEHOLDER_DEVICE
+        ):
+            return True
+
+        if (
+            self._entity_details.poll_tier == PollTier.SLOW
+            and self.coordinator.last_tier == PollTier.FAST
+        ):
+            return False
+
+        if self.coordinator_context.unique_id == DEF_UI_PLACEHOLDER_DEVICE_ID:
+            return self._ui_placeholder_device_id is not None and (
+                self.coordinator.has_changed(self._ui_placeholder_device_id)
+            )
+
+        return self.coordinator.has_changed(self.coordinator_context.unique_id)
+
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
+        """Handle updated data from the coordinator.
+
+        Nothing is done if the refresh was successful but the data for this
+        entity didn't change.  A failed refresh is always written so that the
+        entity can become unavailable.
+        """
+        if self.coordinator.last_update_success and not self._context_has_changed():
+            return
+
         self._set_context_data()
         self._update_values()
         super()._handle_coordinator_update()
 
+    @callback
     def _set_ui_placeholder_device_id(self, device_name: str | None) -> None:
+        """Point the placeholder at the device with the given name.
+
+        The device is taken from the last refresh, so no request is made to
+        the mesh.
+        """
 
         if device_name is not None:
             _mesh: Mesh = self._config_entry.runtime_data.coordinators.get(
@@ -264,6 +496,8 @@ class LinksysVelopEntity(CoordinatorEntity):
         else:
             self._ui_placeholder_device_id = None
         self._set_context_data()
+        self._update_values()
+        self.async_write_ha_state()
 
     def _set_context_data(self) -> None:
         """"""
@@ -277,23 +511,23 @@ class LinksysVelopEntity(CoordinatorEntity):
                 else self._ui_placeholder_device_id
             )
             if device_id is not None:
-                devices: list[Device] = [
-                    d for d in self.coordinator.data.devices if d.unique_id == device_id
-                ]
-                if len(devices) > 0:
-                    self._context_data: Device = devices[0]
+                device: Device | None
+                if (
+                    device := self.coordinator.devices_by_id.get(device_id)
+                ) is not None:
+                    self._context_data: Device = device
             else:
                 self._context_data = None
         elif self._entity_details.entity_type == EntityType.MESH:
             self._context_data: Mesh = self.coordinator.data
         elif self._entity_details.entity_type in EntityType.NODE:
-            nodes: list[Node] = [
-                n
-                for n in self.coordinator.data.nodes
-                if n.unique_id == self.coordinator_context.unique_id
-            ]
-            if len(nodes) > 0:
-                self._context_data: Node = nodes[0]
+            node: Node | None
+            if (
+                node := self.coordinator.nodes_by_id.get(
+                    self.coordinator_context.unique_id
+                )
+            ) is not None:
+                self._context_data: Node = node
 
     def _update_attr_value(self) -> None:
         """"""
@@ -310,6 +544,33 @@ class LinksysVelopEntity(CoordinatorEntity):
                 )
             )
 
+    @callback
+    def _cap_esa_list(self) -> None:
+        """Cap the list in the attributes to the configured number of items.
+
+        The full list is available from the get_attribute_list service.
+        """
+        max_items: int = int(
+            self._config_entry.options.get(
+                CONF_ATTRIBUTES_MAX_ITEMS, DEF_ATTRIBUTES_MAX_ITEMS
+            )
+        )
+        if not max_items or not self._attr_extra_state_attributes:
+            return
+
+        items: list | None = self._attr_extra_state_attributes.get(
+            self._entity_details.esa_list_key
+        )
+        truncated: bool = items is not None and len(items) > max_items
+        self._attr_extra_state_attributes = {
+            **self._attr_extra_state_attributes,
+            "truncated": truncated,
+        }
+        if truncated:
+            self._attr_extra_state_attributes[self._entity_details.esa_list_key] = (
+                items[:max_items]
+            )
+
     @callback
     def _update_esa_value(self) -> None:
         """"""
@@ -322,6 +583,8 @@ class LinksysVelopEntity(CoordinatorEntity):
             self._attr_extra_state_attributes = self._entity_details.esa_value_func(
                 self._context_data
             )
+            if self._entity_details.esa_list_key:
+                self._cap_esa_list()
         else:
             self._attr_extra_state_attributes = None
 
@@ -1,7 +1,9 @@
 """Event entities for the Linksys Velop."""
 
 # region #-- imports --#
+import asyncio
 import logging
+from collections import deque
 from dataclasses import dataclass
 from typing import Any
 
@@ -14,7 +16,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from pyvelop.device import Device
 from pyvelop.node import Node
 
-from .const import DOMAIN
+from .const import DOMAIN, EVENTS_QUEUE_SIZE
 from .entities import EntityDetails, EntityType, LinksysVelopEntity, build_entities
 from .types import EventSubTypes, LinksysVelopConfigEntry
 
@@ -67,9 +69,96 @@ def _build_event_properties(
     return {prop: getattr(obj, prop, None) for prop in properties}
 
 
+_DEVICE_STATUS_PROPERTIES: list[str] = [
+    "name",
+    "parent_name",
+    "status",
+    "unique_id",
+]
+
+
 class LinksysVelopEventEntity(LinksysVelopEntity, EventEntity):
     """"""
 
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialise."""
+        super().__init__(*args, **kwargs)
+        self._drain_task: asyncio.Task | None = None
+        self._event_queue: deque[tuple[str, dict[str, Any]]] = deque(
+            maxlen=EVENTS_QUEUE_SIZE
+        )
+
+    async def _async_drain_events(self) -> None:
+        """Trigger the queued events.
+
+        The state is written for each event, yielding to the event loop in
+        between, so a burst of events doesn't block it.
+        """
+        try:
+            while self._event_queue:
+                event_type, event_attributes = self._event_queue.popleft()
+                self._trigger_event(event_type, event_attributes)
+                self.async_write_ha_state()
+                await asyncio.sleep(0)
+        finally:
+            self._drain_task = None
+
+    def _queue_event(self, event_type: str, event_attributes: dict[str, Any]) -> None:
+        """Queue an event to be triggered.
+
+        The oldest events are dropped if the queue is full.
+        """
+        if len(self._event_queue) == self._event_queue.maxlen:
+            _LOGGER.warning(
+                "Event queue is full, dropping %s event", self._event_queue[0][0]
+            )
+        self._event_queue.append((event_type, event_attributes))
+        if self._drain_task is None:
+            self._drain_task = self._config_entry.async_create_background_task(
+                self.hass, self._async_drain_events(), f"{DOMAIN} event queue"
+            )
+
+    async def _async_process_event_bulk_events(
+        self, event_type: EventSubTypes, objs: list[Device | Node]
+    ) -> None:
+        """"""
+
+        event_attributes: dict[str, Any] = {
+            "count": len(objs),
+            "devices": [
+                _build_event_properties(["name", "unique_id"], obj) for obj in objs
+            ],
+            "events_type": event_type.value,
+        }
+        self._queue_event(EventSubTypes.BULK_EVENTS.value, event_attributes)
+
+    async def _async_process_event_device_offline(self, device: Device) -> None:
+        """"""
+
+        event_attributes: dict[str, Any] = _build_event_properties(
+            _DEVICE_STATUS_PROPERTIES, device
+        )
+        self._queue_event(EventSubTypes.DEVICE_OFFLINE.value, event_attributes)
+
+    async def _async_process_event_device_online(self, device: Device) -> None:
+        """"""
+
+        event_attributes: dict[str, Any] = _build_event_properties(
+            _DEVICE_STATUS_PROPERTIES + ["connected_adapters"], device
+        )
+        self._queue_event(EventSubTypes.DEVICE_ONLINE.value, event_attributes)
+
+    async def _async_process_event_device_roamed(
+        self, device: Device, previous_parent_name: str
+    ) -> None:
+        """"""
+
+        event_attributes: dict[str, Any] = _build_event_properties(
+            _DEVICE_STATUS_PROPERTIES + ["connected_adapters"], device
+        )
+        event_attributes["previous_parent_name"] = previous_parent_name
+        self._queue_event(EventSubTypes.DEVICE_ROAMED.value, event_attributes)
+
     async def _async_process_event_new_device_found(self, device: Device) -> None:
         """"""
 
@@ -89,8 +178,7 @@ class LinksysVelopEventEntity(LinksysVelopEntity, EventEntity):
         event_attributes: dict[str, Any] = _build_event_properties(
             event_properties, device
         )
-        self._trigger_event(EventSubTypes.NEW_DEVICE_FOUND.value, event_attributes)
-        self.async_write_ha_state()
+        self._queue_event(EventSubTypes.NEW_DEVICE_FOUND.value, event_attributes)
 
     async def _async_process_event_new_node_found(self, node: Node) -> None:
         """"""
@@ -109,8 +197,7 @@ class LinksysVelopEventEntity(LinksysVelopEntity, EventEntity):
         event_attributes: dict[str, Any] = _build_event_properties(
             event_properties, node
         )
-        self._trigger_event(EventSubTypes.NEW_NODE_FOUND.value, event_attributes)
-        self.async_write_ha_state()
+        self._queue_event(EventSubTypes.NEW_NODE_FOUND.value, event_attributes)
 
     async def _async_process_event_node_removed(self, node: Node) -> None:
         """"""
@@ -125,11 +212,11 @@ class LinksysVelopEventEntity(LinksysVelopEntity, EventEntity):
         event_attributes: dict[str, Any] = _build_event_properties(
             event_properties, node
         )
-        self._trigger_event(EventSubTypes.NODE_REMOVED.value, event_attributes)
-        self.async_write_ha_state()
+        self._queue_event(EventSubTypes.NODE_REMOVED.value, event_attributes)
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
+        self.async_on_remove(self._event_queue.clear)
         for event in self.event_types:
             func_name: str = f"_async_process_event_{event}"
             if not hasattr(self, func_name):
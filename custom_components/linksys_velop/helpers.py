@@ -2,6 +2,7 @@
 
 # region #-- imports --#
 import logging
+from collections.abc import Iterable
 
 from homeassistant.config_entries import device_registry as dr
 from homeassistant.config_entries import entity_registry as er
@@ -33,17 +34,64 @@ def get_mesh_device_for_config_entry(
     return found_mesh
 
 
+def get_velop_entities_by_unique_id(
+    hass: HomeAssistant, config_entry_id: str
+) -> dict[str, RegistryEntry]:
+    """Map the unique IDs of the entities for a config entry to the registry entry."""
+
+    entity_registry: EntityRegistry = er.async_get(hass)
+    return {
+        entity.unique_id: entity
+        for entity in er.async_entries_for_config_entry(
+            entity_registry, config_entry_id
+        )
+    }
+
+
+def remove_mesh_device_connections(
+    hass: HomeAssistant,
+    config_entry: LinksysVelopConfigEntry,
+    connections: Iterable[tuple[str, str]],
+) -> None:
+    """Remove the given connections from the Mesh device in one update."""
+
+    mesh_device: DeviceEntry | None = get_mesh_device_for_config_entry(
+        hass, config_entry
+    )
+    if mesh_device is None:
+        return
+
+    new_connections: set[tuple[str, str]] = mesh_device.connections.difference(
+        connections
+    )
+    if new_connections != mesh_device.connections:
+        device_registry: DeviceRegistry = dr.async_get(hass)
+        device_registry.async_update_device(
+            mesh_device.id, new_connections=new_connections
+        )
+
+
 def remove_velop_device_from_registry(hass: HomeAssistant, device_id: str) -> None:
     """"""
 
+    remove_velop_devices_from_registry(hass, [device_id])
+
+
+def remove_velop_devices_from_registry(
+    hass: HomeAssistant, device_ids: Iterable[str]
+) -> None:
+    """Remove the given devices from the registry."""
+
     device_registry: DeviceRegistry = dr.async_get(hass)
-    found_device: DeviceEntry | None
-    if (
-        found_device := device_registry.async_get_device({(DOMAIN, device_id)})
-    ) is not None:
-        device_registry.async_remove_device(found_device.id)
-    else:
-        _LOGGER.debug("remove_velop_device_from_registry: device not found")
+    device_id: str
+    for device_id in device_ids:
+        found_device: DeviceEntry | None
+        if (
+            found_device := device_registry.async_get_device({(DOMAIN, device_id)})
+        ) is not None:
+            device_registry.async_remove_device(found_device.id)
+        else:
+            _LOGGER.debug("remove_velop_devices_from_registry: device not found")
 
 
 def remove_velop_entity_from_registry(
@@ -51,13 +99,30 @@ def remove_velop_entity_from_registry(
 ) -> None:
     """Remove an entity from the registry."""
 
+    remove_velop_entities_from_registry(hass, config_entry_id, [unique_id])
+
+
+def remove_velop_entities_from_registry(
+    hass: HomeAssistant, config_entry_id: str, unique_ids: Iterable[str]
+) -> None:
+    """Remove the given entities from the registry.
+
+    The entities for the config entry are only listed once however many are
+    being removed.
+    """
+
+    unique_ids = set(unique_ids)
+    if not unique_ids:
+        return
+
     entity_registry: EntityRegistry = er.async_get(hass)
-    config_entities: list[RegistryEntry] = er.async_entries_for_config_entry(
-        entity_registry, config_entry_id
-    )
-    found_entity: list[RegistryEntry]
-    if found_entity := [e for e in config_entities if e.unique_id == unique_id]:
-        entity_registry.async_remove(found_entity[0].entity_id)
+    unique_id: str
+    entity: RegistryEntry
+    for unique_id, entity in get_velop_entities_by_unique_id(
+        hass, config_entry_id
+    ).items():
+        if unique_id in unique_ids:
+            entity_registry.async_remove(entity.entity_id)
 
 
 #
@@ -1,7 +1,8 @@
 """Logging."""
 
 # region #-- imports --#
-import inspect
+import logging
+import sys
 
 # endregion
 
@@ -14,16 +15,49 @@ class Logger:
         self._unique_id: str = unique_id
         self._prefix: str = prefix
 
-    def format(
-        self, message: str, include_caller: bool = True, include_lineno: bool = False
+    def _format(
+        self,
+        message: str,
+        include_caller: bool,
+        include_lineno: bool,
+        stack_depth: int,
     ) -> str:
-        """Format a log message in the correct format."""
+        """Format the message using the frame stack_depth above this one."""
         caller: str = ""
-        if include_caller:
-            caller_frame: inspect.FrameInfo = inspect.stack()[1]
-            caller = caller_frame.function
-        line_no: str = f" --> line: {caller.lineno}" if include_lineno else ""
+        line_no: str = ""
+        if include_caller or include_lineno:
+            # pylint: disable=protected-access
+            caller_frame = sys._getframe(stack_depth + 1)
+            # pylint: enable=protected-access
+            if include_caller:
+                caller = caller_frame.f_code.co_name
+            if include_lineno:
+                line_no = f" --> line: {caller_frame.f_lineno}"
         unique_id: str = f" ({self._unique_id})" if self._unique_id else ""
         if any([self._prefix, caller, unique_id, line_no]):
             message = f" --> {message}"
         return f"{self._prefix}{caller}{unique_id}{line_no}{message}"
+
+    def format(
+        self, message: str, include_caller: bool = True, include_lineno: bool = False
+    ) -> str:
+        """Format a log message in the correct format."""
+        return self._format(message, include_caller, include_lineno, stack_depth=1)
+
+    def debug(
+        self,
+        logger: logging.Logger,
+        message: str,
+        *args,
+        include_caller: bool = True,
+        include_lineno: bool = False,
+    ) -> None:
+        """Log a debug message in the correct format.
+
+        The message is only formatted if debug logging is enabled.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                self._format(message, include_caller, include_lineno, stack_depth=2),
+                *args,
+            )
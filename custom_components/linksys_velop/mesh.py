@@ -0,0 +1,243 @@
+"""Mesh with request scheduling."""
+
+# region #-- imports --#
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from pyvelop import jnap as api
+from pyvelop.device import Device
+from pyvelop.exceptions import MeshDeviceNotFoundResponse, MeshInvalidOutput
+from pyvelop.mesh import JNAPActionMappings, Mesh
+from pyvelop.node import Node
+
+from .logger import Logger
+
+# endregion
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+MAX_CONCURRENT_REQUESTS_PER_NODE: int = 3
+
+_ATTR_DEVICES: str = "devices"
+
+RequestKey = tuple[str, str, str, bool]
+RequestResult = tuple[api.Request, api.Response]
+
+
+def _is_read_only(action: str, payload: list[dict] | dict | None) -> bool:
+    """Establish if the request can be shared between callers.
+
+    Only requests that retrieve details are safe to share.  Transactions are
+    safe when every action they contain is.
+    """
+    if action == api.Actions.TRANSACTION.value:
+        return bool(payload) and all(
+            _is_read_only(request.get("action", ""), None) for request in payload
+        )
+
+    return action.rsplit("/", 1)[-1].startswith("Get")
+
+
+class RequestScheduler:
+    """Schedule the requests made to the nodes in the mesh.
+
+    Identical read-only requests that are already in flight are shared, rather
+    than being sent again, and the number of concurrent requests to a node is
+    capped.
+    """
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_REQUESTS_PER_NODE) -> None:
+        """Initialise."""
+        self._in_flight: dict[RequestKey, asyncio.Future[RequestResult]] = {}
+        self._limits: dict[str, asyncio.Semaphore] = {}
+        self._max_concurrent: int = max_concurrent
+
+        self.shared_requests: int = 0
+
+    def _get_limit(self, target: str) -> asyncio.Semaphore:
+        """Get the semaphore limiting requests for the given node."""
+        if (limit := self._limits.get(target)) is None:
+            limit = self._limits[target] = asyncio.Semaphore(self._max_concurrent)
+        return limit
+
+    async def async_schedule(
+        self,
+        request_func: Callable[[], Awaitable[RequestResult]],
+        action: str,
+        target: str,
+        payload: list[dict] | dict | None,
+        raise_on_error: bool,
+    ) -> RequestResult:
+        """Schedule the request."""
+        key: RequestKey | None = None
+        if _is_read_only(action, payload):
+            key = (
+                action,
+                target,
+                json.dumps(payload, default=str, sort_keys=True),
+                raise_on_error,
+            )
+            if (in_flight := self._in_flight.get(key)) is not None:
+                self.shared_requests += 1
+                return await asyncio.shield(in_flight)
+
+        async def _async_execute() -> RequestResult:
+            """Execute the request once a slot is available for the node."""
+            async with self._get_limit(target):
+                return await request_func()
+
+        if key is None:
+            return await _async_execute()
+
+        def _done(task: asyncio.Task[RequestResult]) -> None:
+            """Stop sharing the request and retrieve any unawaited exception."""
+            self._in_flight.pop(key, None)
+            if not task.cancelled():
+                task.exception()
+
+        task: asyncio.Task[RequestResult] = asyncio.create_task(_async_execute())
+        self._in_flight[key] = task
+        task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+
+@dataclass
+class DerivedMeshData:
+    """Details derived from the devices in the Mesh.
+
+    These are built once per refresh and shared by the entities that need them.
+    """
+
+    guest_devices: list[dict[str, Any]] = field(default_factory=list)
+    offline_devices: list[dict[str, Any]] = field(default_factory=list)
+    online_devices: list[dict[str, Any]] = field(default_factory=list)
+
+
+class LinksysVelopMesh(Mesh):
+    """Mesh that sends its requests through a RequestScheduler.
+
+    The coordinators and the device tracker timer share the Mesh, so this
+    stops them from overlapping identical requests to the nodes.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialise."""
+        super().__init__(*args, **kwargs)
+        self._scheduler: RequestScheduler = RequestScheduler()
+
+        self.derived: DerivedMeshData = DerivedMeshData()
+        self.failed_refreshes: int = 0
+        self.is_stale: bool = False
+        self.scan_interval: float | None = None
+
+    @property
+    def request_timeout(self) -> int:
+        """Get the number of seconds to wait for a response to a request."""
+        return self._timeout
+
+    @request_timeout.setter
+    def request_timeout(self, value: int) -> None:
+        """Set the number of seconds to wait for a response to a request."""
+        self._timeout = value
+
+    def restore(self, mesh_attributes: dict[int | str, Any]) -> bool:
+        """Restore previously gathered details.
+
+        The details are marked as stale until they are next gathered.
+
+        N.B. pyvelop only allows the details to be read once it has gathered
+        them, which it records in a private flag.  The flag is set so the
+        restored details can be read, as of pyvelop 2024.10.1.  If the flag
+        isn't there the details aren't restored and are gathered as normal.
+
+        :return: True if the details were restored
+        """
+        if not hasattr(self, "_Mesh__gather_details_executed"):
+            _LOGGER.warning(
+                Logger(unique_id=self._node).format(
+                    "unable to restore the details, pyvelop has changed"
+                )
+            )
+            return False
+
+        self._mesh_attributes = mesh_attributes
+        setattr(self, "_Mesh__gather_details_executed", True)
+        self.is_stale = True
+        return True
+
+    @property
+    def connected_node(self) -> str:
+        """Get the node in the mesh that we are connected to.
+
+        This is known before the details are gathered, so the coordinators can
+        be refreshed for the first time alongside each other.
+        """
+        return self._node
+
+    async def _async_make_request(
+        self,
+        action: str,
+        node_address: str | None = None,
+        payload: list[dict] | dict | None = None,
+        raise_on_error: bool = True,
+    ) -> RequestResult:
+        """Execute the API request via the scheduler."""
+        return await self._scheduler.async_schedule(
+            lambda: super(LinksysVelopMesh, self)._async_make_request(
+                action=action,
+                node_address=node_address,
+                payload=payload,
+                raise_on_error=raise_on_error,
+            ),
+            action=action if not isinstance(action, api.Actions) else action.value,
+            target=node_address or self._node,
+            payload=payload,
+            raise_on_error=raise_on_error,
+        )
+
+    async def async_gather_partial_details(self, props: JNAPActionMappings) -> None:
+        """Gather the given details and merge them into those already held.
+
+        The devices are only replaced if the device list was gathered.
+        """
+        log_formatter: Logger = Logger(unique_id=self._node)
+        log_formatter.debug(_LOGGER, "entered, props: %s", props)
+        details: dict[str, Any] = await self._async_gather_details(props=props)
+        if not props & JNAPActionMappings.GET_DEVICES:
+            details.pop(_ATTR_DEVICES, None)
+        self._mesh_attributes.update(details)
+        log_formatter.debug(_LOGGER, "exited")
+
+    async def async_get_device_presence(
+        self, device_id: Iterable[str]
+    ) -> list[Device | Node]:
+        """Get the given devices with only the details needed for presence.
+
+        Only the device list is requested so the other details that make up a
+        full device refresh aren't requested from, or parsed by, the node.
+
+        :param device_id: Iterable of device IDs to get details about
+        :return: List of Device or Node objects whichever is applicable
+        """
+        device_ids: set[str] = set(device_id)
+        all_devices: list[Device | Node] = (
+            await self._async_gather_details(props=JNAPActionMappings.GET_DEVICES)
+        ).get(_ATTR_DEVICES, [])
+        if not all_devices:
+            raise MeshInvalidOutput
+
+        ret: list[Device | Node] = [
+            device for device in all_devices if device.unique_id in device_ids
+        ]
+        if len(ret) != len(device_ids):
+            raise MeshDeviceNotFoundResponse(
+                devices=list(device_ids.difference(device.unique_id for device in ret))
+            )
+
+        return ret
@@ -0,0 +1,206 @@
+"""Presence detection for the device trackers."""
+
+# region #-- imports --#
+from __future__ import annotations
+
+import heapq
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+from pyvelop.device import Device
+
+from .logger import Logger
+
+# endregion
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PresenceState:
+    """The details of a device that a device tracker reports.
+
+    The time the results were retrieved changes on every poll so it isn't
+    compared.
+    """
+
+    ip_address: str | None
+    is_connected: bool
+    mac_address: str | None
+    results_time: int | None = field(compare=False)
+
+    @classmethod
+    def from_device(cls, device: Device) -> PresenceState:
+        """Build the state from the given device."""
+        adapter: dict = next(iter(device.network), {})
+        return cls(
+            ip_address=adapter.get("ip", "") if adapter else None,
+            is_connected=device.status,
+            mac_address=dr.format_mac(adapter.get("mac", "")) if adapter else None,
+            results_time=device.results_time,
+        )
+
+
+class PresenceEngine:
+    """Route presence changes to the device trackers.
+
+    The state of each tracked device is compared to the state from the
+    previous poll so that only the trackers for devices that have changed
+    are notified.
+
+    The consider home periods for all the trackers are held in a single heap
+    with one timer for the earliest expiry.
+    """
+
+    def __init__(self, hass: HomeAssistant, unique_id: str = "") -> None:
+        """Initialise."""
+        self._expiries: dict[str, tuple[float, Callable[[], None]]] = {}
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._expiry_timer: CALLBACK_TYPE | None = None
+        self._expiry_timer_at: float | None = None
+        self._hass: HomeAssistant = hass
+        self._log_formatter: Logger = Logger(unique_id=unique_id)
+        self._states: dict[str, PresenceState] = {}
+        self._subscribers: dict[str, Callable[[PresenceState], None]] = {}
+
+    @callback
+    def _async_expire(self, _: datetime) -> None:
+        """Call the targets for every expiry that is due."""
+        self._expiry_timer = None
+        self._expiry_timer_at = None
+        now: float = dt_util.utcnow().timestamp()
+        expired: list[Callable[[], None]] = []
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            when, device_id = heapq.heappop(self._expiry_heap)
+            # entries that were cancelled or replaced are left in the heap
+            expiry: tuple[float, Callable[[], None]] | None = self._expiries.get(
+                device_id
+            )
+            if expiry is not None and expiry[0] == when:
+                expired.append(self._expiries.pop(device_id)[1])
+
+        self._log_formatter.debug(
+            _LOGGER, "%i consider home periods expired", len(expired)
+        )
+        target: Callable[[], None]
+        for target in expired:
+            target()
+        self._async_schedule_expiry_timer()
+
+    @callback
+    def _async_schedule_expiry_timer(self) -> None:
+        """Make sure the timer fires no later than the earliest expiry.
+
+        A timer that fires early is left alone, it reschedules itself when it
+        finds nothing to expire, so cancelling expiries doesn't churn timers.
+        """
+        while self._expiry_heap and (
+            (expiry := self._expiries.get(self._expiry_heap[0][1])) is None
+            or expiry[0] != self._expiry_heap[0][0]
+        ):
+            heapq.heappop(self._expiry_heap)
+
+        if not self._expiry_heap:
+            return
+
+        when: float = self._expiry_heap[0][0]
+        if self._expiry_timer_at is not None and self._expiry_timer_at <= when:
+            return
+
+        if self._expiry_timer is not None:
+            self._expiry_timer()
+            self._expiry_timer = None
+        self._expiry_timer_at = when
+        self._expiry_timer = async_track_point_in_utc_time(
+            self._hass, self._async_expire, dt_util.utc_from_timestamp(when)
+        )
+
+    @callback
+    def async_expire_at(
+        self, device_id: str, when: float, target: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Call the target when the consider home period for a device expires.
+
+        :param device_id: the ID of the device
+        :param when: the timestamp that the period expires
+        :param target: callback to make when the period expires
+        :return: callback that cancels the expiry
+        """
+        self._expiries[device_id] = (when, target)
+        heapq.heappush(self._expiry_heap, (when, device_id))
+        self._async_schedule_expiry_timer()
+
+        @callback
+        def _async_cancel() -> None:
+            """Cancel the expiry."""
+            if self._expiries.get(device_id, (None, None))[1] is target:
+                self._expiries.pop(device_id)
+                self._async_schedule_expiry_timer()
+
+        return _async_cancel
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the timer for the expiries."""
+        if self._expiry_timer is not None:
+            self._expiry_timer()
+            self._expiry_timer = None
+        self._expiry_timer_at = None
+        self._expiries.clear()
+        self._expiry_heap.clear()
+
+    @callback
+    def async_process(self, devices: list[Device]) -> None:
+        """Notify the subscribers of the devices that have changed.
+
+        Devices without a subscriber are ignored.
+        """
+        changed: dict[str, PresenceState] = {}
+        device: Device
+        for device in devices:
+            if device.unique_id not in self._subscribers:
+                continue
+            state: PresenceState = PresenceState.from_device(device)
+            if self._states.get(device.unique_id) != state:
+                self._states[device.unique_id] = state
+                changed[device.unique_id] = state
+
+        self._log_formatter.debug(
+            _LOGGER, "%i of %i tracked devices changed", len(changed), len(devices)
+        )
+        device_id: str
+        for device_id, state in changed.items():
+            if (target := self._subscribers.get(device_id)) is not None:
+                target(state)
+
+    @callback
+    def async_subscribe(
+        self,
+        device_id: str,
+        state: PresenceState,
+        target: Callable[[PresenceState], None],
+    ) -> CALLBACK_TYPE:
+        """Subscribe to the changes for a device.
+
+        :param device_id: the ID of the device to receive the changes for
+        :param state: the state that the subscriber already knows about
+        :param target: callback to receive the new state
+        :return: callback that unsubscribes
+        """
+        self._states[device_id] = state
+        self._subscribers[device_id] = target
+
+        @callback
+        def _async_unsubscribe() -> None:
+            """Remove the subscription."""
+            if self._subscribers.get(device_id) is target:
+                self._subscribers.pop(device_id)
+                self._states.pop(device_id, None)
+
+        return _async_unsubscribe
@@ -94,13 +94,14 @@ class LinksysVelopSelectPlaceholderEntity(LinksysVelopSelect):
     """Linksys Velop sensor."""
 
     async def async_select_option(self, option: str) -> None:
-        """"""
+        """Point the placeholder device at the selected device.
+
+        The device is already known from the last refresh, so the mesh isn't
+        refreshed.
+        """
 
         self._attr_current_option = option
         async_dispatcher_send(self.hass, SIGNAL_UI_PLACEHOLDER_DEVICE_UPDATE, option)
-        await self._config_entry.runtime_data.coordinators.get(
-            CoordinatorTypes.MESH
-        ).async_refresh()
 
     @callback
     def _handle_coordinator_update(self) -> None:
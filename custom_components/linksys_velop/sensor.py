@@ -3,7 +3,6 @@
 # region #-- imports --#
 import logging
 from dataclasses import dataclass
-from typing import Any
 
 from homeassistant.components.sensor import DOMAIN as ENTITY_DOMAIN
 from homeassistant.components.sensor import (
@@ -12,18 +11,27 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import SIGNAL_STRENGTH_DECIBELS_MILLIWATT, UnitOfDataRate
+from homeassistant.const import (
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    UnitOfDataRate,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util
-from pyvelop.device import Device
-from pyvelop.mesh import Mesh
 from pyvelop.node import NodeType
 
 from .const import CONF_NODE_IMAGES
-from .entities import EntityDetails, EntityType, LinksysVelopEntity, build_entities
-from .types import CoordinatorTypes, LinksysVelopConfigEntry
+from .entities import (
+    EntityDetails,
+    EntityType,
+    LinksysVelopEntity,
+    async_add_entities_for_new_nodes,
+    build_entities,
+    get_entity_class,
+)
+from .types import CoordinatorTypes, LinksysVelopConfigEntry, PollTier
 
 # endregion
 
@@ -35,25 +43,6 @@ class SensorDetails(EntityDetails):
     description: SensorEntityDescription
 
 
-def get_devices(mesh: Mesh, state: bool = True) -> list[dict[str, Any]]:
-    """Get the matching devices from the Mesh."""
-    ret: list[dict[str, Any]] = []
-    device: Device
-    for device in mesh.devices:
-        if device.status is state:
-            ret.append({"name": device.name, "id": device.unique_id})
-            for adapter in device.network:
-                if adapter.get("ip"):
-                    ret[-1] = dict(
-                        **ret[-1],
-                        ip=adapter.get("ip"),
-                        connection=adapter.get("type"),
-                        guest_network=adapter.get("guest_network"),
-                    )
-
-    return ret
-
-
 ENTITY_DETAILS: list[SensorDetails] = [
     # region #-- device sensors --#
     SensorDetails(
@@ -102,6 +91,7 @@ ENTITY_DETAILS: list[SensorDetails] = [
             translation_key="ip",
         ),
         entity_type=EntityType.DEVICE,
+        lean_core=True,
         state_value_func=lambda d: next(iter(d.connected_adapters), {}).get("ip"),
     ),
     SensorDetails(
@@ -168,6 +158,7 @@ ENTITY_DETAILS: list[SensorDetails] = [
             translation_key="parent_name",
         ),
         entity_type=EntityType.DEVICE,
+        lean_core=True,
     ),
     SensorDetails(
         description=SensorEntityDescription(
@@ -188,6 +179,7 @@ ENTITY_DETAILS: list[SensorDetails] = [
             translation_key="signal_strength",
         ),
         entity_type=EntityType.DEVICE,
+        lean_core=True,
         state_value_func=lambda d: next(iter(d.connected_adapters), {}).get("rssi"),
     ),
     SensorDetails(
@@ -226,6 +218,7 @@ ENTITY_DETAILS: list[SensorDetails] = [
             translation_key="available_storage",
         ),
         entity_type=EntityType.MESH,
+        poll_tier=PollTier.SLOW,
         esa_value_func=lambda m: {"partitions": m.storage_available or None},
         state_value_func=lambda m: len(m.storage_available),
     ),
@@ -239,6 +232,7 @@ ENTITY_DETAILS: list[SensorDetails] = [
             translation_key="dhcp_reservations",
         ),
         entity_type=EntityType.MESH,
+        esa_list_key="reservations",
         esa_value_func=lambda m: {
             "reservations": m.dhcp_reservations,
         },
@@ -253,12 +247,9 @@ ENTITY_DETAILS: list[SensorDetails] = [
             translation_key="guest_devices",
         ),
         entity_type=EntityType.MESH,
-        esa_value_func=lambda m: {
-            "devices": [d for d in get_devices(m) if d.get("guest_network")]
-        },
-        state_value_func=lambda m: len(
-            [d for d in get_devices(m) if d.get("guest_network")]
-        ),
+        esa_list_key="devices",
+        esa_value_func=lambda m: {"devices": m.derived.guest_devices},
+        state_value_func=lambda m: len(m.derived.guest_devices),
     ),
     SensorDetails(
         description=SensorEntityDescription(
@@ -269,8 +260,9 @@ ENTITY_DETAILS: list[SensorDetails] = [
             translation_key="offline_devices",
         ),
         entity_type=EntityType.MESH,
-        esa_value_func=lambda m: {"devices": get_devices(m, False)},
-        state_value_func=lambda m: len(get_devices(m, False)),
+        esa_list_key="devices",
+        esa_value_func=lambda m: {"devices": m.derived.offline_devices},
+        state_value_func=lambda m: len(m.derived.offline_devices),
     ),
     SensorDetails(
         description=SensorEntityDescription(
@@ -281,8 +273,20 @@ ENTITY_DETAILS: list[SensorDetails] = [
             translation_key="online_devices",
         ),
         entity_type=EntityType.MESH,
-        esa_value_func=lambda m: {"devices": get_devices(m)},
-        state_value_func=lambda m: len(get_devices(m)),
+        esa_list_key="devices",
+        esa_value_func=lambda m: {"devices": m.derived.online_devices},
+        state_value_func=lambda m: len(m.derived.online_devices),
+    ),
+    SensorDetails(
+        description=SensorEntityDescription(
+            device_class=SensorDeviceClass.DURATION,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            key="scan_interval",
+            name="Scan Interval",
+            native_unit_of_measurement=UnitOfTime.SECONDS,
+            translation_key="scan_interval",
+        ),
+        entity_type=EntityType.MESH,
     ),
     SensorDetails(
         coordinator_type=CoordinatorTypes.SPEEDTEST,
@@ -367,6 +371,7 @@ ENTITY_DETAILS: list[SensorDetails] = [
             translation_key="wan_ip",
         ),
         entity_type=EntityType.MESH,
+        poll_tier=PollTier.SLOW,
     ),
     # endregion
     # region #-- node sensors --#
@@ -446,6 +451,7 @@ ENTITY_DETAILS: list[SensorDetails] = [
             translation_key="connected_devices",
         ),
         entity_type=EntityType.NODE,
+        esa_list_key="devices",
         esa_value_func=lambda n: (
             {"devices": n.connected_devices} if n.connected_devices else {}
         ),
@@ -524,11 +530,29 @@ async def async_setup_entry(
     entities_to_add: list[LinksysVelopSensor] = []
 
     entities = build_entities(ENTITY_DETAILS, config_entry, ENTITY_DOMAIN)
-    entities_to_add = [LinksysVelopSensor(**entity) for entity in entities]
+    entities_to_add = [
+        get_entity_class(
+            config_entry,
+            entity["entity_details"],
+            LinksysVelopSensor,
+            LinksysVelopSensorUnrecordedList,
+        )(**entity)
+        for entity in entities
+    ]
 
     if len(entities_to_add) > 0:
         async_add_entities(entities_to_add)
 
+    async_add_entities_for_new_nodes(
+        hass,
+        config_entry,
+        ENTITY_DETAILS,
+        ENTITY_DOMAIN,
+        LinksysVelopSensor,
+        async_add_entities,
+        LinksysVelopSensorUnrecordedList,
+    )
+
 
 class LinksysVelopSensor(LinksysVelopEntity, SensorEntity):
     """Linksys Velop sensor."""
@@ -554,3 +578,11 @@ class LinksysVelopSensor(LinksysVelopEntity, SensorEntity):
                 self._attr_native_value = None
         else:
             self._attr_native_value = None
+
+
+class LinksysVelopSensorUnrecordedList(LinksysVelopSensor):
+    """Linksys Velop sensor whose attribute list isn't recorded."""
+
+    _unrecorded_attributes = frozenset(
+        entity.esa_list_key for entity in ENTITY_DETAILS if entity.esa_list_key
+    )
@@ -3,17 +3,29 @@
 # region #-- imports --#
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import functools
 import logging
 import uuid
+from typing import Any, Awaitable, Callable
 
+import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
 from pyvelop.device import Device, ParentalControl
-from pyvelop.mesh import Mesh
+from pyvelop.mesh import JNAPActionMappings, Mesh
+from pyvelop.node import Node
 
-from .const import DOMAIN
+from .const import BULK_SERVICES_CONCURRENCY, DOMAIN
+from .coordinator import DEVICES_REFRESH_PROPS, LinksysVelopUpdateCoordinator
 from .logger import Logger
 from .types import CoordinatorTypes, LinksysVelopConfigEntry
 
@@ -22,6 +34,60 @@ from .types import CoordinatorTypes, LinksysVelopConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
+_ATTRIBUTE_LISTS: dict[str, Callable[[Mesh], list[Any]]] = {
+    "dhcp_reservations": lambda m: m.dhcp_reservations,
+    "guest_devices": lambda m: m.derived.guest_devices,
+    "mac_filtering_addresses": lambda m: m.mac_filtering_addresses,
+    "offline_devices": lambda m: m.derived.offline_devices,
+    "online_devices": lambda m: m.derived.online_devices,
+}
+_ATTRIBUTE_LIST_CONNECTED_DEVICES: str = "connected_devices"
+
+_DEVICE_FILTERS: dict[str, Callable[[Device], bool]] = {
+    "guest": lambda d: any(adapter.get("guest_network") for adapter in d.network),
+    "offline": lambda d: d.status is False,
+    "online": lambda d: d.status is True,
+}
+
+_SCHEMA_BULK_DEVICES: dict[vol.Marker, Any] = {
+    vol.Required("mesh"): str,
+    vol.Optional("devices", default=[]): vol.All(cv.ensure_list, [str]),
+    vol.Optional("filter"): vol.In(list(_DEVICE_FILTERS)),
+}
+_SCHEMA_WEEKDAYS: dict[vol.Marker, Any] = {
+    vol.Optional(weekday.name): list for weekday in ParentalControl.WEEKDAYS
+}
+
+
+def _internet_access_rules(pause: bool) -> dict[str, str]:
+    """Build the parental control rules that pause or resume Internet access."""
+    if not pause:
+        return {}
+
+    return dict(
+        map(
+            lambda weekday, readable_schedule: (
+                weekday.name,
+                readable_schedule,
+            ),
+            ParentalControl.WEEKDAYS,
+            ("00:00-00:00",) * len(ParentalControl.WEEKDAYS),
+        )
+    )
+
+
+def _internet_rules(**kwargs) -> dict[str, str | None]:
+    """Build the parental control rules from the times for each weekday."""
+    return dict(
+        map(
+            lambda weekday: (
+                weekday.name,
+                ",".join(kwargs.get(weekday.name, [])) or None,
+            ),
+            ParentalControl.WEEKDAYS,
+        )
+    )
+
 
 def deprectated_service(solution: str):
     """Mark a service as deprecated."""
@@ -66,6 +132,10 @@ class LinksysVelopServiceHandler:
                 }
             )
         },
+        "delete_devices": {
+            "schema": vol.Schema(_SCHEMA_BULK_DEVICES),
+            "supports_response": SupportsResponse.OPTIONAL,
+        },
         "device_internet_access": {
             "schema": vol.Schema(
                 {
@@ -90,6 +160,35 @@ class LinksysVelopServiceHandler:
                 }
             )
         },
+        "devices_internet_access": {
+            "schema": vol.Schema(
+                {
+                    **_SCHEMA_BULK_DEVICES,
+                    vol.Required("pause"): bool,
+                }
+            ),
+            "supports_response": SupportsResponse.OPTIONAL,
+        },
+        "devices_internet_rules": {
+            "schema": vol.Schema({**_SCHEMA_BULK_DEVICES, **_SCHEMA_WEEKDAYS}),
+            "supports_response": SupportsResponse.OPTIONAL,
+        },
+        "get_attribute_list": {
+            "schema": vol.Schema(
+                {
+                    vol.Required("mesh"): str,
+                    vol.Required("attribute"): vol.In(
+                        [*_ATTRIBUTE_LISTS, _ATTRIBUTE_LIST_CONNECTED_DEVICES]
+                    ),
+                    vol.Optional("node"): str,
+                    vol.Optional("offset", default=0): vol.All(
+                        vol.Coerce(int), vol.Range(min=0)
+                    ),
+                    vol.Optional("limit"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                }
+            ),
+            "supports_response": SupportsResponse.ONLY,
+        },
         "reboot_node": {
             "schema": vol.Schema(
                 {
@@ -108,10 +207,20 @@ class LinksysVelopServiceHandler:
                 }
             )
         },
+        "rename_devices": {
+            "schema": vol.Schema(
+                {
+                    vol.Required("mesh"): str,
+                    vol.Required("names"): {str: str},
+                }
+            ),
+            "supports_response": SupportsResponse.OPTIONAL,
+        },
     }
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialise."""
+        self._coordinator: LinksysVelopUpdateCoordinator | None = None
         self._hass: HomeAssistant = hass
         self._log_formatter: Logger = Logger()
         self._mesh: Mesh | None = None
@@ -143,47 +252,185 @@ class LinksysVelopServiceHandler:
         """
         ret: list[Device] | None = None
 
-        if isinstance(self._mesh, Mesh):
-            ret = [
-                device
-                for device in self._mesh.devices
-                if getattr(device, attribute, "").lower() == value.lower()
-            ]
+        if self._coordinator is not None:
+            device: Device | None
+            if attribute == "unique_id" and (
+                (device := self._coordinator.devices_by_id.get(value)) is not None
+            ):
+                ret = [device]
+            else:
+                ret = [
+                    device
+                    for device in self._coordinator.devices_by_id.values()
+                    if getattr(device, attribute, "").lower() == value.lower()
+                ]
 
         return ret or None
 
-    async def _async_service_call(self, call: ServiceCall) -> None:
+    @staticmethod
+    def _get_coordinator(
+        config_entry: LinksysVelopConfigEntry,
+    ) -> LinksysVelopUpdateCoordinator:
+        """Get the Mesh coordinator for the config entry.
+
+        The handler is shared by all the config entries so the bulk services
+        resolve the coordinator once and hold on to it, rather than using
+        the one for the latest call.
+        """
+        return config_entry.runtime_data.coordinators.get(CoordinatorTypes.MESH)
+
+    @staticmethod
+    def _get_devices(
+        coordinator: LinksysVelopUpdateCoordinator,
+        devices: list[str],
+        device_filter: str | None = None,
+    ) -> dict[str, Device | None]:
+        """Get the devices from the Mesh for a bulk service.
+
+        The devices are matched on ID or name, with a single pass over the
+        devices, and those matching the filter are added.  Each device is
+        only included once and those that can't be found map to None.
+
+        N.B. this uses the devices from the last poll to retrieve
+        details.
+        """
+        ret: dict[str, Device | None] = {}
+        by_name: dict[str, Device] = {}
+        device: Device
+        for device in coordinator.devices_by_id.values():
+            by_name.setdefault(device.name.lower(), device)
+            if device_filter is not None and _DEVICE_FILTERS[device_filter](device):
+                ret[device.unique_id] = device
+
+        found: Device | None
+        included: set[str] = set(ret)
+        requested: str
+        for requested in devices:
+            found = coordinator.devices_by_id.get(requested) or by_name.get(
+                requested.lower()
+            )
+            if found is not None:
+                if found.unique_id in included:
+                    continue
+                included.add(found.unique_id)
+            ret[requested] = found
+
+        return ret
+
+    async def _async_run_bulk(
+        self,
+        coordinator: LinksysVelopUpdateCoordinator,
+        devices: dict[str, Device | None],
+        action: Callable[[Device], Awaitable[None]],
+        lock: asyncio.Lock | None = None,
+    ) -> ServiceResponse:
+        """Run the action for each device and summarise the results.
+
+        No more than BULK_SERVICES_CONCURRENCY requests are made to the mesh
+        at once.  If lock is given the actions hold it in turn, for writes
+        that must not overlap.  The devices are refreshed once at the end.
+        """
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(BULK_SERVICES_CONCURRENCY)
+
+        async def _async_run(requested: str, device: Device | None) -> dict[str, Any]:
+            """Run the action for a single device."""
+            result: dict[str, Any] = {
+                "device": requested,
+                "id": device.unique_id if device is not None else None,
+                "success": False,
+            }
+            if device is None:
+                result["error"] = "Unknown device"
+                return result
+
+            async with semaphore, lock or contextlib.nullcontext():
+                try:
+                    await action(device)
+                except Exception as err:
+                    result["error"] = str(err)
+                else:
+                    result["success"] = True
+            return result
+
+        results: list[dict[str, Any]] = await asyncio.gather(
+            *(_async_run(requested, device) for requested, device in devices.items())
+        )
+        succeeded: int = sum(result["success"] for result in results)
+        self._log_formatter.debug(
+            _LOGGER, "%i of %i devices succeeded", succeeded, len(results)
+        )
+        if succeeded:
+            await coordinator.async_refresh_scoped(DEVICES_REFRESH_PROPS)
+
+        return {
+            "devices": results,
+            "failed": len(results) - succeeded,
+            "succeeded": succeeded,
+        }
+
+    def _get_node(self, value: str) -> Node | None:
+        """Get a node from the Mesh using the name or ID.
+
+        N.B. this uses the nodes from the last poll to retrieve
+        details.
+        """
+        if self._coordinator is None:
+            return None
+
+        if (node := self._coordinator.nodes_by_id.get(value)) is not None:
+            return node
+
+        return next(
+            (
+                node
+                for node in self._coordinator.nodes_by_id.values()
+                if node.name.lower() == value.lower()
+            ),
+            None,
+        )
+
+    async def _async_service_call(self, call: ServiceCall) -> ServiceResponse:
         """Call the required method based on the given argument.
 
+        Failures are raised rather than logged for services that return a
+        response, so the caller gets the reason instead of an empty response.
+
         :param call: the service call that should be made
-        :return: None
+        :return: the response from the service if it has one
         """
-        _LOGGER.debug(self._log_formatter.format("entered, call: %s"), call)
+        self._log_formatter.debug(_LOGGER, "entered, call: %s", call)
 
+        response: ServiceResponse = None
         args = call.data.copy()
         if (
             config_entry := self._get_config_entry_from_mesh_id(args.pop("mesh", ""))
         ) is not None:
-            self._mesh = config_entry.runtime_data.coordinators.get(
+            self._coordinator = config_entry.runtime_data.coordinators.get(
                 CoordinatorTypes.MESH
-            )._mesh
-            _LOGGER.debug(self._log_formatter.format("Using %s"), self._mesh)
+            )
+            self._mesh = self._coordinator._mesh
+            self._log_formatter.debug(_LOGGER, "Using %s", self._mesh)
             method = getattr(self, call.service, None)
             if method:
                 try:
-                    await method(**args, config_entry=config_entry)
+                    response = await method(**args, config_entry=config_entry)
                 except Exception as err:
+                    if call.return_response:
+                        raise HomeAssistantError(str(err)) from err
                     _LOGGER.warning(
                         self._log_formatter.format("%s", include_caller=False), err
                     )
         else:
+            if call.return_response:
+                raise HomeAssistantError("Unknown Mesh specified")
             _LOGGER.warning(
                 self._log_formatter.format(
                     "Unknown Mesh specified", include_caller=False
                 )
             )
 
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        self._log_formatter.debug(_LOGGER, "exited")
+        return response
 
     def register_services(self) -> None:
         """Register the services."""
@@ -193,6 +440,9 @@ class LinksysVelopServiceHandler:
                 service=service_name,
                 service_func=self._async_service_call,
                 schema=service_details.get("schema", None),
+                supports_response=service_details.get(
+                    "supports_response", SupportsResponse.NONE
+                ),
             )
 
     def unregister_services(self) -> None:
@@ -204,7 +454,7 @@ class LinksysVelopServiceHandler:
         self, config_entry: LinksysVelopConfigEntry, **kwargs
     ) -> None:
         """Remove a device from the device list on the mesh."""
-        _LOGGER.debug(self._log_formatter.format("entered, kwargs: %s"), kwargs)
+        self._log_formatter.debug(_LOGGER, "entered, kwargs: %s", kwargs)
 
         try:
             _ = uuid.UUID(kwargs.get("device"))
@@ -212,13 +462,37 @@ class LinksysVelopServiceHandler:
         except ValueError:
             await self._mesh.async_delete_device_by_name(device=kwargs.get("device"))
 
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        self._log_formatter.debug(_LOGGER, "exited")
+
+    async def delete_devices(
+        self, config_entry: LinksysVelopConfigEntry, **kwargs
+    ) -> ServiceResponse:
+        """Remove devices from the device list on the mesh."""
+        self._log_formatter.debug(_LOGGER, "entered, kwargs: %s", kwargs)
+
+        coordinator: LinksysVelopUpdateCoordinator = self._get_coordinator(config_entry)
+        mesh: Mesh = coordinator._mesh
+
+        async def _async_delete(device: Device) -> None:
+            """Delete the device."""
+            await mesh.async_delete_device_by_id(device=device.unique_id)
+
+        ret: ServiceResponse = await self._async_run_bulk(
+            coordinator,
+            self._get_devices(
+                coordinator, kwargs.get("devices", []), kwargs.get("filter")
+            ),
+            _async_delete,
+        )
+
+        self._log_formatter.debug(_LOGGER, "exited")
+        return ret
 
     async def device_internet_access(
         self, config_entry: LinksysVelopConfigEntry, **kwargs
     ) -> None:
         """Change state of Internet access for a device."""
-        _LOGGER.debug(self._log_formatter.format("entered, %s"), kwargs)
+        self._log_formatter.debug(_LOGGER, "entered, %s", kwargs)
 
         try:
             _ = uuid.UUID(kwargs.get("device"))
@@ -233,32 +507,24 @@ class LinksysVelopServiceHandler:
         if device is None:
             raise ValueError(f"Unknown device: {kwargs.get('device', '')}") from None
 
-        rules_to_apply: dict[str, str] = {}
-        if kwargs.get("pause", False):
-            rules_to_apply = dict(
-                map(
-                    lambda weekday, readable_schedule: (
-                        weekday.name,
-                        readable_schedule,
-                    ),
-                    ParentalControl.WEEKDAYS,
-                    ("00:00-00:00",) * len(ParentalControl.WEEKDAYS),
-                )
+        # the handler may be retargeted while waiting for the lock
+        mesh: Mesh = self._mesh
+        async with self._coordinator.get_write_lock(
+            JNAPActionMappings.GET_PARENTAL_CONTROL_INFO
+        ):
+            await mesh.async_set_parental_control_rules(
+                device_id=device[0].unique_id,
+                force_enable=True if kwargs.get("pause", False) else False,
+                rules=_internet_access_rules(kwargs.get("pause", False)),
             )
 
-        await self._mesh.async_set_parental_control_rules(
-            device_id=device[0].unique_id,
-            force_enable=True if kwargs.get("pause", False) else False,
-            rules=rules_to_apply,
-        )
-
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        self._log_formatter.debug(_LOGGER, "exited")
 
     async def device_internet_rules(
         self, config_entry: LinksysVelopConfigEntry, **kwargs
     ) -> None:
         """Set Parental Control rules for the device."""
-        _LOGGER.debug(self._log_formatter.format("entered, %s"), kwargs)
+        self._log_formatter.debug(_LOGGER, "entered, %s", kwargs)
 
         device: list[Device] | None = None
         try:
@@ -272,25 +538,110 @@ class LinksysVelopServiceHandler:
         if device is None:
             raise ValueError(f"Unknown device: {kwargs.get('device', '')}") from None
 
-        rules_to_apply: dict[str, str] = {}
-        rules_to_apply = dict(
-            map(
-                lambda weekday: (
-                    weekday.name,
-                    ",".join(kwargs.get(weekday.name, [])) or None,
-                ),
-                ParentalControl.WEEKDAYS,
+        rules_to_apply: dict[str, str | None] = _internet_rules(**kwargs)
+
+        self._log_formatter.debug(_LOGGER, "rules_to_apply: %s", rules_to_apply)
+
+        # the handler may be retargeted while waiting for the lock
+        mesh: Mesh = self._mesh
+        async with self._coordinator.get_write_lock(
+            JNAPActionMappings.GET_PARENTAL_CONTROL_INFO
+        ):
+            await mesh.async_set_parental_control_rules(
+                device_id=device[0].unique_id,
+                rules=rules_to_apply,
             )
+
+        self._log_formatter.debug(_LOGGER, "exited")
+
+    async def devices_internet_access(
+        self, config_entry: LinksysVelopConfigEntry, **kwargs
+    ) -> ServiceResponse:
+        """Change state of Internet access for devices."""
+        self._log_formatter.debug(_LOGGER, "entered, kwargs: %s", kwargs)
+
+        pause: bool = kwargs.get("pause", False)
+        coordinator: LinksysVelopUpdateCoordinator = self._get_coordinator(config_entry)
+        mesh: Mesh = coordinator._mesh
+
+        async def _async_set_access(device: Device) -> None:
+            """Pause or resume Internet access for the device."""
+            await mesh.async_set_parental_control_rules(
+                device_id=device.unique_id,
+                force_enable=pause,
+                rules=_internet_access_rules(pause),
+            )
+
+        # the rules are read and written back as a whole so can't overlap
+        ret: ServiceResponse = await self._async_run_bulk(
+            coordinator,
+            self._get_devices(
+                coordinator, kwargs.get("devices", []), kwargs.get("filter")
+            ),
+            _async_set_access,
+            coordinator.get_write_lock(JNAPActionMappings.GET_PARENTAL_CONTROL_INFO),
         )
 
-        _LOGGER.debug(self._log_formatter.format("rules_to_apply: %s"), rules_to_apply)
+        self._log_formatter.debug(_LOGGER, "exited")
+        return ret
 
-        await self._mesh.async_set_parental_control_rules(
-            device_id=device[0].unique_id,
-            rules=rules_to_apply,
+    async def devices_internet_rules(
+        self, config_entry: LinksysVelopConfigEntry, **kwargs
+    ) -> ServiceResponse:
+        """Set Parental Control rules for devices."""
+        self._log_formatter.debug(_LOGGER, "entered, kwargs: %s", kwargs)
+
+        rules_to_apply: dict[str, str | None] = _internet_rules(**kwargs)
+        coordinator: LinksysVelopUpdateCoordinator = self._get_coordinator(config_entry)
+        mesh: Mesh = coordinator._mesh
+
+        async def _async_set_rules(device: Device) -> None:
+            """Set the rules for the device."""
+            await mesh.async_set_parental_control_rules(
+                device_id=device.unique_id, rules=rules_to_apply
+            )
+
+        # the rules are read and written back as a whole so can't overlap
+        ret: ServiceResponse = await self._async_run_bulk(
+            coordinator,
+            self._get_devices(
+                coordinator, kwargs.get("devices", []), kwargs.get("filter")
+            ),
+            _async_set_rules,
+            coordinator.get_write_lock(JNAPActionMappings.GET_PARENTAL_CONTROL_INFO),
         )
 
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        self._log_formatter.debug(_LOGGER, "exited")
+        return ret
+
+    async def get_attribute_list(
+        self, config_entry: LinksysVelopConfigEntry, **kwargs
+    ) -> ServiceResponse:
+        """Get a page of a list that is held in the entity attributes.
+
+        The lists in the attributes can be capped, this returns them in full.
+        """
+        self._log_formatter.debug(_LOGGER, "entered, kwargs: %s", kwargs)
+
+        items: list[Any]
+        if kwargs.get("attribute") == _ATTRIBUTE_LIST_CONNECTED_DEVICES:
+            node: Node | None = self._get_node(kwargs.get("node", ""))
+            if node is None:
+                raise ValueError(f"Unknown node: {kwargs.get('node', '')}") from None
+            items = node.connected_devices
+        else:
+            items = _ATTRIBUTE_LISTS[kwargs.get("attribute")](self._coordinator.data)
+
+        offset: int = kwargs.get("offset", 0)
+        limit: int | None = kwargs.get("limit")
+        ret: ServiceResponse = {
+            "items": items[offset : offset + limit if limit else None],
+            "offset": offset,
+            "total": len(items),
+        }
+
+        self._log_formatter.debug(_LOGGER, "exited")
+        return ret
 
     @deprectated_service(
         solution="Use the button available on the node device or mesh."
@@ -305,20 +656,20 @@ class LinksysVelopServiceHandler:
 
         :return:None
         """
-        _LOGGER.debug(self._log_formatter.format("entered, kwargs: %s"), kwargs)
+        self._log_formatter.debug(_LOGGER, "entered, kwargs: %s", kwargs)
 
         await self._mesh.async_reboot_node(
             node_name=kwargs.get("node_name", ""),
             force=kwargs.get("is_primary", False),
         )
 
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        self._log_formatter.debug(_LOGGER, "exited")
 
     async def rename_device(
         self, config_entry: LinksysVelopConfigEntry, **kwargs
     ) -> None:
         """Rename a device on the Mesh."""
-        _LOGGER.debug(self._log_formatter.format("entered, kwargs: %s"), kwargs)
+        self._log_formatter.debug(_LOGGER, "entered, kwargs: %s", kwargs)
 
         try:
             _ = uuid.UUID(kwargs.get("device"))
@@ -335,12 +686,41 @@ class LinksysVelopServiceHandler:
 
         # only make the request to rename if they are different
         if device[0].name != kwargs.get("new_name"):
-            _LOGGER.debug(
-                self._log_formatter.format("renaming device: %s"),
-                device[0].unique_id,
+            self._log_formatter.debug(
+                _LOGGER, "renaming device: %s", device[0].unique_id
             )
             await self._mesh.async_rename_device(
                 device_id=device[0].unique_id, name=kwargs.get("new_name")
             )
 
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        self._log_formatter.debug(_LOGGER, "exited")
+
+    async def rename_devices(
+        self, config_entry: LinksysVelopConfigEntry, **kwargs
+    ) -> ServiceResponse:
+        """Rename devices on the Mesh."""
+        self._log_formatter.debug(_LOGGER, "entered, kwargs: %s", kwargs)
+
+        coordinator: LinksysVelopUpdateCoordinator = self._get_coordinator(config_entry)
+        mesh: Mesh = coordinator._mesh
+        names: dict[str, str] = kwargs.get("names", {})
+        devices: dict[str, Device | None] = self._get_devices(coordinator, list(names))
+        new_names: dict[str, str] = {
+            device.unique_id: names[requested]
+            for requested, device in devices.items()
+            if device is not None
+        }
+
+        async def _async_rename(device: Device) -> None:
+            """Rename the device if the name is different."""
+            if device.name != new_names[device.unique_id]:
+                await mesh.async_rename_device(
+                    device_id=device.unique_id, name=new_names[device.unique_id]
+                )
+
+        ret: ServiceResponse = await self._async_run_bulk(
+            coordinator, devices, _async_rename
+        )
+
+        self._log_formatter.debug(_LOGGER, "exited")
+        return ret
@@ -0,0 +1,252 @@
+"""Persisted storage."""
+
+# region #-- imports --#
+import logging
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from pyvelop.device import Device
+from pyvelop.mesh import JNAPActionMappings
+from pyvelop.node import Node
+
+from .const import (
+    DOMAIN,
+    KNOWN_DEVICES_EXPIRY_DAYS,
+    KNOWN_DEVICES_SAVE_INTERVAL_SECS,
+    SNAPSHOT_SAVE_DELAY_SECS,
+    STORAGE_VERSION,
+)
+from .logger import Logger
+from .mesh import LinksysVelopMesh
+
+# endregion
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+_ATTR_DEVICES: str = "devices"
+_ATTR_MESH: str = "mesh"
+
+# the devices are stored already processed so the raw list isn't needed
+_SNAPSHOT_IGNORE: set[int | str] = {
+    _ATTR_DEVICES,
+    JNAPActionMappings.GET_DEVICES.value,
+}
+# the secrets are left out of the snapshot, the first refresh after the
+# snapshot is restored gathers everything so they are back straight away.
+# Addresses and serials are kept as the devices and nodes are identified by
+# them, as they are in the registries.
+_SNAPSHOT_SECRETS: dict[int, tuple[str, ...]] = {
+    JNAPActionMappings.GET_GUEST_NETWORK_INFO.value: (
+        "guestSSID",
+        "guestWPAPassphrase",
+    ),
+}
+
+
+def _without_secrets(key: int | str, value: Any) -> Any:
+    """Remove the secrets from the radios in the given details."""
+    if (secrets := _SNAPSHOT_SECRETS.get(key)) is None or not isinstance(value, dict):
+        return value
+
+    return value | {
+        "radios": [
+            {
+                radio_key: radio_value
+                for radio_key, radio_value in radio.items()
+                if radio_key not in secrets
+            }
+            for radio in value.get("radios", [])
+        ]
+    }
+
+
+def _serialise_device(device: Device | Node) -> dict[str, Any]:
+    """Build the storable form of a device or node."""
+    ret: dict[str, Any] = {
+        "attribs": getattr(device, "_attribs", {}),
+        "node": isinstance(device, Node),
+    }
+    if isinstance(device, Node):
+        ret["connected_devices"] = getattr(device, "_Node__connected_devices", None)
+        ret["parent_name"] = getattr(device, "_Node__parent_name", None)
+
+    return ret
+
+
+def _deserialise_device(stored: dict[str, Any]) -> Device | Node:
+    """Build a device or node from the stored form."""
+    if not stored.get("node"):
+        return Device(**stored.get("attribs", {}))
+
+    node: Node = Node(**stored.get("attribs", {}))
+    setattr(node, "_Node__connected_devices", stored.get("connected_devices"))
+    setattr(node, "_Node__parent_name", stored.get("parent_name"))
+    return node
+
+
+class MeshSnapshotStore:
+    """Store the last known good state of the mesh.
+
+    The snapshot allows the entities to be set up from the last known state
+    while the mesh is refreshed in the background.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialise."""
+        self._log_formatter: Logger = Logger(unique_id=entry_id)
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.mesh"
+        )
+
+    async def async_restore(self, mesh: LinksysVelopMesh) -> bool:
+        """Restore the snapshot into the given mesh.
+
+        :return: True if there was a snapshot to restore
+        """
+        try:
+            snapshot: dict[str, Any] | None = await self._store.async_load()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning(
+                self._log_formatter.format("unable to load the snapshot: %s"), err
+            )
+            return False
+
+        if not snapshot:
+            self._log_formatter.debug(_LOGGER, "no snapshot found")
+            return False
+
+        # JSON turns the integer keys into strings so they need turning back
+        mesh_attributes: dict[int | str, Any] = {
+            int(key) if key.isdigit() else key: value
+            for key, value in snapshot.get(_ATTR_MESH, {}).items()
+        }
+        mesh_attributes[_ATTR_DEVICES] = [
+            _deserialise_device(device) for device in snapshot.get(_ATTR_DEVICES, [])
+        ]
+        if not mesh.restore(mesh_attributes):
+            return False
+
+        self._log_formatter.debug(
+            _LOGGER,
+            "restored snapshot with %i devices",
+            len(mesh_attributes[_ATTR_DEVICES]),
+        )
+
+        return True
+
+    @callback
+    def async_schedule_save(self, mesh: LinksysVelopMesh) -> None:
+        """Save the current state of the mesh after a delay."""
+
+        @callback
+        def _data_to_save() -> dict[str, Any]:
+            """Build the snapshot."""
+            mesh_attributes: dict[int | str, Any] = getattr(mesh, "_mesh_attributes")
+            return {
+                _ATTR_DEVICES: [
+                    _serialise_device(device)
+                    for device in mesh_attributes.get(_ATTR_DEVICES, [])
+                ],
+                _ATTR_MESH: {
+                    key: _without_secrets(key, value)
+                    for key, value in mesh_attributes.items()
+                    if key not in _SNAPSHOT_IGNORE
+                },
+            }
+
+        self._store.async_delay_save(_data_to_save, SNAPSHOT_SAVE_DELAY_SECS)
+
+    async def async_remove(self) -> None:
+        """Remove the snapshot."""
+        await self._store.async_remove()
+
+
+class KnownDeviceStore:
+    """Store the devices and nodes that have been seen on the mesh.
+
+    Each is held with the time it was first and last seen so that a device
+    can be established as new to the mesh, rather than new since the
+    integration was last loaded.  Those not seen for KNOWN_DEVICES_EXPIRY_DAYS
+    are forgotten when the store is saved.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialise."""
+        self._known: dict[str, dict[str, int]] = {}
+        self._last_saved: float | None = None
+        self._log_formatter: Logger = Logger(unique_id=entry_id)
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.known_devices"
+        )
+
+    async def async_load(self) -> None:
+        """Load the known devices."""
+        try:
+            stored: dict[str, Any] | None = await self._store.async_load()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning(
+                self._log_formatter.format("unable to load the known devices: %s"),
+                err,
+            )
+            stored = None
+
+        self._known = (stored or {}).get(_ATTR_DEVICES, {})
+        self._log_formatter.debug(_LOGGER, "%i known devices", len(self._known))
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Forget the expired devices and get the details to store."""
+        expired_before: int = int(time.time()) - KNOWN_DEVICES_EXPIRY_DAYS * 86400
+        expired: list[str] = [
+            unique_id
+            for unique_id, known in self._known.items()
+            if known.get("last_seen", 0) < expired_before
+        ]
+        unique_id: str
+        for unique_id in expired:
+            self._known.pop(unique_id)
+        if expired:
+            self._log_formatter.debug(
+                _LOGGER, "forgot %i expired known devices", len(expired)
+            )
+
+        return {_ATTR_DEVICES: self._known}
+
+    @callback
+    def async_update(self, unique_ids: Iterable[str]) -> set[str]:
+        """Mark the given devices as seen.
+
+        Nothing is reported as new the first time that devices are seen, as
+        the whole mesh would be.  Changes to only the last seen times are
+        saved at most every KNOWN_DEVICES_SAVE_INTERVAL_SECS.
+
+        :param unique_ids: the IDs of the devices and nodes currently on the mesh
+        :return: the IDs that have not been seen before
+        """
+        now: int = int(time.time())
+        first_seen: bool = not self._known
+        ret: set[str] = set()
+        unique_id: str
+        for unique_id in unique_ids:
+            if (known := self._known.get(unique_id)) is None:
+                ret.add(unique_id)
+                self._known[unique_id] = {"first_seen": now, "last_seen": now}
+            else:
+                known["last_seen"] = now
+
+        if (
+            ret
+            or self._last_saved is None
+            or time.monotonic() - self._last_saved >= KNOWN_DEVICES_SAVE_INTERVAL_SECS
+        ):
+            self._last_saved = time.monotonic()
+            self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY_SECS)
+
+        return set() if first_seen else ret
+
+    async def async_remove(self) -> None:
+        """Remove the known devices."""
+        await self._store.async_remove()
@@ -1,6 +1,7 @@
 """Switch entities for Linksys Velop."""
 
 # region #-- imports --#
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from typing import Any, Callable
@@ -11,9 +12,11 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from pyvelop.device import Device, ParentalControl
-from pyvelop.mesh import Mesh
+from pyvelop.mesh import JNAPActionMappings, Mesh
 
 from . import LinksysVelopConfigEntry
+from .const import SWITCH_CONFIRM_DELAY_SECS
+from .coordinator import DEVICES_REFRESH_PROPS
 from .entities import (
     EntityContext,
     EntityDetails,
@@ -21,7 +24,7 @@ from .entities import (
     LinksysVelopEntity,
     build_entities,
 )
-from .types import CoordinatorTypes
+from .types import CoordinatorTypes, PollTier
 
 # endregion
 
@@ -33,6 +36,11 @@ class SwitchDetails(EntityDetails):
     description: SwitchEntityDescription
     off_func: Callable | str = field(kw_only=True)
     on_func: Callable | str = field(kw_only=True)
+    refresh_props: JNAPActionMappings = field(
+        default=DEVICES_REFRESH_PROPS, kw_only=True
+    )
+    # the details written to, if they aren't the details refreshed
+    resource: JNAPActionMappings | None = field(default=None, kw_only=True)
 
 
 def _get_device_internet_access_state(device_details: Device) -> bool | None:
@@ -86,6 +94,7 @@ ENTITY_DETAILS: list[SwitchDetails] = [
         entity_type=EntityType.DEVICE,
         off_func=_async_set_device_internet_access_state_off,
         on_func=_async_set_device_internet_access_state_on,
+        resource=JNAPActionMappings.GET_PARENTAL_CONTROL_INFO,
         state_value_func=_get_device_internet_access_state,
     ),
     # endregion
@@ -98,12 +107,14 @@ ENTITY_DETAILS: list[SwitchDetails] = [
             translation_key="guest_wifi",
         ),
         entity_type=EntityType.MESH,
+        poll_tier=PollTier.SLOW,
         esa_value_func=lambda m: {
             f"network {idx}": network
             for idx, network in enumerate(m.guest_wifi_details)
         },
         off_func="async_set_guest_wifi_state",
         on_func="async_set_guest_wifi_state",
+        refresh_props=JNAPActionMappings.GET_GUEST_NETWORK_INFO,
     ),
     SwitchDetails(
         description=SwitchEntityDescription(
@@ -113,8 +124,10 @@ ENTITY_DETAILS: list[SwitchDetails] = [
             translation_key="homekit",
         ),
         entity_type=EntityType.MESH,
+        poll_tier=PollTier.SLOW,
         off_func="async_set_homekit_state",
         on_func="async_set_homekit_state",
+        refresh_props=JNAPActionMappings.GET_HOMEKIT_SETTINGS,
     ),
     SwitchDetails(
         description=SwitchEntityDescription(
@@ -135,6 +148,7 @@ ENTITY_DETAILS: list[SwitchDetails] = [
         ),
         off_func="async_set_parental_control_state",
         on_func="async_set_parental_control_state",
+        refresh_props=JNAPActionMappings.GET_PARENTAL_CONTROL_INFO,
     ),
     SwitchDetails(
         description=SwitchEntityDescription(
@@ -144,8 +158,10 @@ ENTITY_DETAILS: list[SwitchDetails] = [
             translation_key="wps",
         ),
         entity_type=EntityType.MESH,
+        poll_tier=PollTier.SLOW,
         off_func="async_set_wps_state",
         on_func="async_set_wps_state",
+        refresh_props=JNAPActionMappings.GET_WPS_SERVER_SETTINGS,
     ),
     # endregion
 ]
@@ -168,7 +184,16 @@ async def async_setup_entry(
 
 
 class LinksysVelopSwitch(LinksysVelopEntity, SwitchEntity):
-    """Linksys Velop switch."""
+    """Linksys Velop switch.
+
+    The requested state is shown straight away.  It is confirmed by
+    refreshing the details a few seconds after the write and rolled back if
+    the mesh disagrees.  Writes to the same details are serialised across
+    the switches so rapid changes don't race.
+    """
+
+    _optimistic_state: bool | None = None
+    _pending_writes: int = 0
 
     def __init__(
         self,
@@ -188,30 +213,64 @@ class LinksysVelopSwitch(LinksysVelopEntity, SwitchEntity):
         self._off_func = entity_details.off_func
         self._on_func = entity_details.on_func
 
+    async def _async_write_state(self, state: bool) -> None:
+        """Write the state to the mesh."""
+        write_func: Callable | str = self._on_func if state else self._off_func
+        if isinstance(write_func, Callable):
+            await write_func(self._config_entry, self._context_data)
+        elif (func := getattr(self.coordinator.data, write_func, None)) is not None:
+            if isinstance(func, Callable):
+                await func(state)
+
+    async def _async_set_state(self, state: bool) -> None:
+        """Show the state straight away, write it and then confirm it."""
+        self._attr_is_on = self._optimistic_state = state
+        self._pending_writes += 1
+        self.async_write_ha_state()
+        try:
+            async with self.coordinator.get_write_lock(
+                self._entity_details.resource or self._entity_details.refresh_props
+            ):
+                await self._async_write_state(state)
+                await asyncio.sleep(SWITCH_CONFIRM_DELAY_SECS)
+                await self.coordinator.async_refresh_scoped(
+                    self._entity_details.refresh_props
+                )
+        finally:
+            self._pending_writes -= 1
+            # a later write confirms the state it shows
+            if not self._pending_writes:
+                self._optimistic_state = None
+                self._set_context_data()
+                self._update_attr_value()
+                # the mesh can't confirm the state if the refresh failed
+                if self._attr_is_on != state and self.coordinator.last_update_success:
+                    _LOGGER.error(
+                        self._log_formatter(
+                            "%s wasn't turned %s, rolling back to the state on the mesh",
+                            include_caller=False,
+                        ),
+                        self.entity_id,
+                        "on" if state else "off",
+                    )
+                self.async_write_ha_state()
+
     async def async_turn_on(self, **kwargs: Any) -> None:
         """"""
-        if isinstance(self._on_func, Callable):
-            await self._on_func(self._config_entry, self._context_data)
-            await self.coordinator.async_refresh()
-        elif (func := getattr(self.coordinator.data, self._on_func, None)) is not None:
-            if isinstance(func, Callable):
-                await func(True)
-                await self.coordinator.async_refresh()
+        await self._async_set_state(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """"""
-        if isinstance(self._off_func, Callable):
-            await self._off_func(self._config_entry, self._context_data)
-            await self.coordinator.async_refresh()
-        elif (func := getattr(self.coordinator.data, self._off_func, None)) is not None:
-            if isinstance(func, Callable):
-                await func(False)
-                await self.coordinator.async_refresh()
+        await self._async_set_state(False)
 
     @callback
     def _update_attr_value(self) -> None:
         """"""
 
+        if self._optimistic_state is not None:
+            self._attr_is_on = self._optimistic_state
+            return
+
         if self._context_data is None:
             self._attr_is_on = None
             return
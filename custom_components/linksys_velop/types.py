@@ -3,7 +3,7 @@
 # region #-- imports --#
 from dataclasses import dataclass, field
 from enum import StrEnum, auto
-from typing import Any
+from typing import Any, Callable
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
@@ -19,11 +19,36 @@ class CoordinatorTypes(StrEnum):
     SPEEDTEST = "coordinator_speedtest"
 
 
+class PollTier(StrEnum):
+    """The refresh tiers used by the mesh coordinator."""
+
+    FAST = auto()
+    # only the details changed by an action
+    SCOPED = auto()
+    SLOW = auto()
+
+
+class MeshChangeType(StrEnum):
+    """The types of change to a device or node between refreshes."""
+
+    ADDED = auto()
+    IP = auto()
+    NAME = auto()
+    PARENT = auto()
+    REMOVED = auto()
+    STATUS = auto()
+
+
 class EventSubTypes(StrEnum):
     """"""
 
+    BULK_EVENTS = auto()
+    DEVICE_OFFLINE = auto()
+    DEVICE_ONLINE = auto()
+    DEVICE_ROAMED = auto()
     NEW_DEVICE_FOUND = auto()
     NEW_NODE_FOUND = auto()
+    NODE_REMOVED = auto()
 
 
 @dataclass
@@ -33,8 +58,13 @@ class LinksysVelopData:
     coordinators: dict[CoordinatorTypes, DataUpdateCoordinator[Any]] = field(
         default_factory=dict
     )
+    device_tracker_timer: Callable[[], None] | None = None
     intensive_running_tasks: list[str] = field(default_factory=list)
+    known_devices: Any = None
+    options: dict[str, Any] = field(default_factory=dict)
+    presence_engine: Any = None
     service_handler: Any = None
+    snapshot_store: Any = None
 
 
 type LinksysVelopConfigEntry = ConfigEntry[LinksysVelopData]
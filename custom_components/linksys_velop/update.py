@@ -15,7 +15,13 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import LinksysVelopConfigEntry
 from .const import CONF_NODE_IMAGES
-from .entities import EntityDetails, EntityType, LinksysVelopEntity, build_entities
+from .entities import (
+    EntityDetails,
+    EntityType,
+    LinksysVelopEntity,
+    async_add_entities_for_new_nodes,
+    build_entities,
+)
 
 # endregion
 
@@ -60,10 +66,25 @@ async def async_setup_entry(
     if len(entities_to_add) > 0:
         async_add_entities(entities_to_add)
 
+    async_add_entities_for_new_nodes(
+        hass,
+        config_entry,
+        ENTITY_DETAILS,
+        ENTITY_DOMAIN,
+        LinksysVelopUpdate,
+        async_add_entities,
+    )
+
 
 class LinksysVelopUpdate(LinksysVelopEntity, UpdateEntity):
     """Linksys Velop update entity."""
 
+    def _context_has_changed(self) -> bool:
+        """Also consider the Mesh as the auto update setting is held there."""
+        return super()._context_has_changed() or self.coordinator.has_changed(
+            self._config_entry.entry_id
+        )
+
     @callback
     def _update_attr_value(self) -> None:
         """"""